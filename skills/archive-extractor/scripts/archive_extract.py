@@ -1,20 +1,57 @@
 #!/usr/bin/env python3
 """
-Archive Extractor - Extract archives using 7z CLI.
+Archive Extractor - Extract archives in-process (zip, tar.*) or with the 7z CLI.
 
 Usage:
     python archive_extract.py ARCHIVE [OPTIONS]
+    python archive_extract.py ARCHIVE [ARCHIVE ...] [OPTIONS]
+    python archive_extract.py --dir DIRECTORY [OPTIONS]
 """
 
 import argparse
 import json
+import os
+import re
+import shutil
 import subprocess
 import sys
+import tarfile
+import tempfile
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Optional
 
+# Member classification reuses file-router's extension table when the sibling
+# skill is present; without it archives are recognised by SUPPORTED_EXTENSIONS
+# and --selective is unavailable
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "file-router" / "scripts"))
+
+try:
+    from file_router import detect_by_extension
+except ImportError:
+    detect_by_extension = None
+
 SUPPORTED_EXTENSIONS = {".zip", ".rar", ".7z", ".tar", ".gz", ".tgz", ".bz2", ".xz"}
 
+# Buffer for streaming archive members to disk
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Multi-part archives: only the first volume is extracted
+MULTIPART_FIRST = re.compile(r"\.(?:part0*1\.rar|7z\.001|zip\.001)$", re.IGNORECASE)
+MULTIPART_REST = re.compile(
+    r"\.(?:part\d+\.rar|(?:7z|zip)\.\d{3}|r\d{2}|z\d{2})$", re.IGNORECASE
+)
+MULTIPART_STEM = re.compile(r"(?:\.part\d+|\.tar|\.7z|\.zip)$", re.IGNORECASE)
+
+DEFAULT_BATCH_JOBS = 4
+DEFAULT_MAX_DEPTH = 2
+
+
+class NativeUnsupportedError(Exception):
+    """Archive feature the in-process backend can't handle; use 7z instead."""
+
 
 def find_7z() -> str:
     """Find 7z executable."""
@@ -42,6 +79,180 @@ def find_7z() -> str:
     )
 
 
+def is_archive_name(name: str) -> bool:
+    """True for archives worth extracting; later volumes of multi-part sets are not."""
+    if MULTIPART_FIRST.search(name):
+        return True
+    if MULTIPART_REST.search(name):
+        return False
+    if detect_by_extension is None:
+        return name.lower().endswith(tuple(SUPPORTED_EXTENSIONS))
+    route = detect_by_extension(name)
+    return bool(route and route["processor"] == "archive-extractor")
+
+
+def archive_stem(path: Path) -> str:
+    """Folder name for an archive (course.tar.gz, course.part1.rar -> course)."""
+    return MULTIPART_STEM.sub("", path.stem)
+
+
+def is_skipped_member(name: str) -> bool:
+    """True when file-router would route this member to "skip" (video, audio)."""
+    route = detect_by_extension(name)
+    return bool(route and route["processor"] == "skip")
+
+
+def list_7z_members(sevenzip: str, path: Path, password: Optional[str] = None) -> list:
+    """List (name, size) for the files in an archive via `7z l -slt`."""
+    cmd = [sevenzip, "l", "-slt", str(path)]
+    if password:
+        cmd.append(f"-p{password}")
+    result = subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or "7z listing failed")
+
+    members = []
+    entry = {}
+    # Member blocks follow the "----------" separator line
+    listing = result.stdout.split("\n----------\n", 1)[-1]
+    for line in listing.splitlines() + [""]:
+        if not line.strip():
+            if "Path" in entry and entry.get("Folder") != "+":
+                members.append((entry["Path"], int(entry.get("Size") or 0)))
+            entry = {}
+            continue
+        key, sep, value = line.partition(" = ")
+        if sep:
+            entry[key.strip()] = value
+    return members
+
+
+def native_format(path: Path) -> Optional[str]:
+    """Return "zip" or "tar" when the archive can be extracted in-process."""
+    try:
+        if zipfile.is_zipfile(path):
+            return "zip"
+        if tarfile.is_tarfile(path):
+            return "tar"
+    except OSError:
+        pass
+    return None
+
+
+def safe_target(dest: Path, member_name: str) -> Optional[Path]:
+    """Resolve a member path under dest; None for absolute or escaping paths."""
+    parts = [p for p in member_name.replace("\\", "/").split("/") if p not in ("", ".")]
+    if not parts or ".." in parts or ":" in parts[0]:
+        return None
+    if member_name.startswith(("/", "\\")):
+        return None
+    return dest.joinpath(*parts)
+
+
+def write_member(src, target: Path, mtime: Optional[float]) -> None:
+    """Stream one member to disk with large buffered copies."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, "wb") as dst:
+        shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+    if mtime is not None:
+        os.utime(target, (mtime, mtime))
+
+
+def zip_member_mtime(info: zipfile.ZipInfo) -> Optional[float]:
+    """Local timestamp of a zip member, or None if its DOS date is invalid."""
+    try:
+        return time.mktime(info.date_time + (0, 0, -1))
+    except (ValueError, OverflowError):
+        return None
+
+
+def extract_native(
+    path: Path,
+    dest: Path,
+    fmt: str,
+    password: Optional[str] = None,
+    overwrite: bool = False,
+    selective: bool = False,
+) -> tuple:
+    """
+    Extract a zip or tar archive in-process.
+
+    Members are streamed straight to disk and the manifest is built during
+    extraction, so dest is never rescanned. Existing files are kept unless
+    overwrite is set. Unsafe member paths and tar links/devices are skipped.
+    With selective, members file-router would skip are not written.
+
+    Returns (extracted_files, skipped_members) where skipped_members holds
+    (name, size) pairs.
+    """
+    extracted_files = []
+    skipped_members = []
+
+    def record(target: Path) -> None:
+        extracted_files.append(
+            {
+                "path": str(target),
+                "relative_path": str(target.relative_to(dest)),
+                "size": target.stat().st_size,
+            }
+        )
+
+    if fmt == "zip":
+        pwd = password.encode("utf-8") if password else None
+        with zipfile.ZipFile(path) as zf:
+            for info in zf.infolist():
+                if info.is_dir():
+                    continue
+                target = safe_target(dest, info.filename)
+                if target is None:
+                    continue
+                if selective and is_skipped_member(info.filename):
+                    skipped_members.append((info.filename, info.file_size))
+                    continue
+                if target.exists() and not overwrite:
+                    record(target)
+                    continue
+                mtime = zip_member_mtime(info)
+                try:
+                    with zf.open(info, pwd=pwd) as src:
+                        write_member(src, target, mtime)
+                except NotImplementedError as e:
+                    raise NativeUnsupportedError(str(e))
+                record(target)
+    else:
+        # Stream mode reads compressed tars sequentially without seeking
+        with tarfile.open(path, "r|*") as tf:
+            for member in tf:
+                if not member.isfile():
+                    continue
+                target = safe_target(dest, member.name)
+                if target is None:
+                    continue
+                if selective and is_skipped_member(member.name):
+                    skipped_members.append((member.name, member.size))
+                    continue
+                if target.exists() and not overwrite:
+                    record(target)
+                    continue
+                write_member(tf.extractfile(member), target, member.mtime)
+                record(target)
+
+    return extracted_files, skipped_members
+
+
+def skipped_summary(skipped_members: list) -> dict:
+    """Result fields describing members left out by selective extraction."""
+    return {
+        "skipped_count": len(skipped_members),
+        "skipped_bytes": sum(size for _, size in skipped_members),
+    }
+
+
 def extract_archive(
     archive_path: str,
     output_dir: Optional[str] = None,
@@ -49,8 +260,20 @@ def extract_archive(
     flat: bool = False,
     overwrite: bool = False,
     quiet: bool = False,
+    backend: str = "auto",
+    selective: bool = False,
 ) -> dict:
-    """Extract archive using 7z."""
+    """
+    Extract archive.
+
+    backend "auto" extracts zip and tar.* archives in-process and uses 7z for
+    everything else (or when the archive needs features zipfile lacks, such as
+    AES encryption); "native" and "7z" force one backend.
+
+    With selective, members are classified by name using file-router's
+    extension table and those routed to "skip" (video, audio) are not
+    extracted; the result reports skipped_count and skipped_bytes.
+    """
     path = Path(archive_path)
 
     if not path.exists():
@@ -63,13 +286,51 @@ def extract_archive(
         dest = path.parent
     else:
         # Create subfolder from archive name (handle compound extensions)
-        stem = path.stem
-        if stem.endswith(".tar"):
-            stem = stem[:-4]
-        dest = path.parent / stem
+        dest = path.parent / archive_stem(path)
 
     dest.mkdir(parents=True, exist_ok=True)
 
+    if backend != "7z":
+        fmt = native_format(path)
+        if fmt:
+            if not quiet:
+                print(f"Extracting: {path.name} -> {dest}", file=sys.stderr)
+            try:
+                extracted_files, skipped_members = extract_native(
+                    path, dest, fmt, password, overwrite, selective
+                )
+                result = {
+                    "source": str(path.absolute()),
+                    "destination": str(dest.absolute()),
+                    "file_count": len(extracted_files),
+                    "files": extracted_files,
+                    "backend": "native",
+                    "status": "success",
+                }
+                if selective:
+                    result.update(skipped_summary(skipped_members))
+                return result
+            except RuntimeError as e:
+                # zipfile reports missing/wrong passwords as RuntimeError
+                if "password" in str(e).lower() or "encrypted" in str(e).lower():
+                    return {
+                        "error": "Archive is password protected. Use --password flag.",
+                        "source": str(path.absolute()),
+                    }
+                return {"error": f"Extraction failed: {e}", "source": str(path.absolute())}
+            except NativeUnsupportedError as e:
+                if backend == "native":
+                    return {"error": f"Extraction failed: {e}", "source": str(path.absolute())}
+            except Exception as e:
+                # Corrupt members surface as BadZipFile, TarError, OSError, EOFError,
+                # zlib.error, lzma.LZMAError, ...; all are reported, never raised
+                return {"error": f"Extraction failed: {e}", "source": str(path.absolute())}
+        elif backend == "native":
+            return {
+                "error": f"Native backend supports zip and tar archives only: {path.name}",
+                "source": str(path.absolute()),
+            }
+
     # Find 7z
     try:
         sevenzip = find_7z()
@@ -92,7 +353,23 @@ def extract_archive(
     if not quiet:
         print(f"Extracting: {path.name} -> {dest}", file=sys.stderr)
 
+    exclude_file = None
+    skipped_members = []
     try:
+        if selective:
+            skipped_members = [
+                (name, size)
+                for name, size in list_7z_members(sevenzip, path, password)
+                if is_skipped_member(name)
+            ]
+            if skipped_members:
+                with tempfile.NamedTemporaryFile(
+                    "w", suffix=".txt", encoding="utf-8", delete=False
+                ) as f:
+                    f.write("\n".join(name for name, _ in skipped_members))
+                    exclude_file = f.name
+                cmd.extend(["-scsUTF-8", f"-x@{exclude_file}"])
+
         result = subprocess.run(
             cmd,
             capture_output=True,
@@ -125,16 +402,109 @@ def extract_archive(
                     }
                 )
 
-        return {
+        result = {
             "source": str(path.absolute()),
             "destination": str(dest.absolute()),
             "file_count": len(extracted_files),
             "files": extracted_files,
+            "backend": "7z",
             "status": "success",
         }
+        if selective:
+            result.update(skipped_summary(skipped_members))
+        return result
 
     except Exception as e:
         return {"error": str(e), "source": str(path.absolute())}
+    finally:
+        if exclude_file:
+            os.unlink(exclude_file)
+
+
+def find_archives(dirpath: str) -> list:
+    """Archives under a directory, in sorted order."""
+    return sorted(
+        str(p) for p in Path(dirpath).rglob("*") if p.is_file() and is_archive_name(p.name)
+    )
+
+
+def extract_batch(
+    archives: list,
+    output_dir: Optional[str] = None,
+    jobs: int = DEFAULT_BATCH_JOBS,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    quiet: bool = False,
+    **options,
+) -> dict:
+    """
+    Extract many archives concurrently, recursing into nested archives.
+
+    Each top-level archive goes to output_dir/<name>/ (or next to itself
+    without output_dir). Archives found in extracted output are extracted in
+    place, up to max_depth levels below the top. options are passed through to
+    extract_archive. Returns one combined manifest; nested archives that were
+    expanded are left out of its file list.
+    """
+    results = {}
+    seen = set()
+    pending = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+
+        def submit(key: tuple, archive: str, depth: int, parent: Optional[str], dest) -> None:
+            resolved = str(Path(archive).resolve())
+            if resolved in seen:
+                return
+            seen.add(resolved)
+            future = executor.submit(
+                extract_archive, archive, output_dir=dest, quiet=quiet, **options
+            )
+            pending[future] = (key, depth, parent, archive)
+
+        for index, archive in enumerate(archives):
+            dest = str(Path(output_dir) / archive_stem(Path(archive))) if output_dir else None
+            submit((index,), archive, 0, None, dest)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key, depth, parent, archive = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # One bad archive must not lose the rest of the batch
+                    result = {
+                        "error": f"Extraction failed: {e}",
+                        "source": str(Path(archive).absolute()),
+                    }
+                result["depth"] = depth
+                result["parent"] = parent
+                results[key] = result
+
+                if result.get("status") != "success" or depth >= max_depth:
+                    continue
+                nested = [f for f in result["files"] if is_archive_name(f["path"])]
+                for index, entry in enumerate(nested):
+                    entry["nested_archive"] = True
+                    submit(key + (index,), entry["path"], depth + 1, result["source"], None)
+
+    ordered = [results[key] for key in sorted(results)]
+    files = [
+        f
+        for result in ordered
+        for f in result.get("files", [])
+        if not f.get("nested_archive")
+    ]
+    failed = sum(1 for result in ordered if result.get("status") != "success")
+
+    return {
+        "archive_count": len(ordered),
+        "failed_count": failed,
+        "file_count": len(files),
+        "files": files,
+        "archives": ordered,
+        "status": "success" if not failed else ("partial" if failed < len(ordered) else "error"),
+    }
 
 
 def format_human_readable(result: dict) -> str:
@@ -146,8 +516,11 @@ def format_human_readable(result: dict) -> str:
         f"Archive: {Path(result.get('source', 'unknown')).name}",
         f"Extracting to: {result.get('destination', 'unknown')}",
         "",
-        f"Extracted {result.get('file_count', 0)} files:",
     ]
+    if "skipped_count" in result:
+        skipped_mb = result["skipped_bytes"] / 1024 / 1024
+        lines.append(f"Skipped {result['skipped_count']} media files ({skipped_mb:.1f} MB)")
+    lines.append(f"Extracted {result.get('file_count', 0)} files:")
 
     files = result.get("files", [])
     for f in files[:20]:  # Show first 20 files
@@ -165,11 +538,31 @@ def format_human_readable(result: dict) -> str:
     return "\n".join(lines)
 
 
+def format_batch_human_readable(batch: dict) -> str:
+    """Format a batch manifest for human consumption."""
+    lines = [
+        f"Archives: {batch['archive_count']} ({batch['failed_count']} failed)",
+        f"Files extracted: {batch['file_count']}",
+        "",
+    ]
+    for result in batch["archives"]:
+        indent = "  " * (result.get("depth", 0) + 1)
+        name = Path(result.get("source", "unknown")).name
+        if "error" in result:
+            lines.append(f"{indent}{name}: Error: {result['error']}")
+        else:
+            lines.append(
+                f"{indent}{name} -> {result['destination']} ({result['file_count']} files)"
+            )
+    return "\n".join(lines)
+
+
 def main():
     parser = argparse.ArgumentParser(
-        description="Archive Extractor - Extract archives using 7z CLI"
+        description="Archive Extractor - Extract archives in-process or using 7z CLI"
     )
-    parser.add_argument("archive", nargs="?", help="Archive file to extract")
+    parser.add_argument("archives", nargs="*", help="Archive file(s) to extract")
+    parser.add_argument("-d", "--dir", help="Extract every archive found under a directory")
     parser.add_argument("-o", "--output", help="Output directory")
     parser.add_argument("-j", "--json", action="store_true", help="Output as JSON")
     parser.add_argument("-p", "--password", help="Archive password")
@@ -181,23 +574,75 @@ def main():
     parser.add_argument(
         "--overwrite", action="store_true", help="Overwrite existing files"
     )
+    parser.add_argument(
+        "--selective", action="store_true",
+        help="Skip members file-router routes to skip (video, audio)",
+    )
+    parser.add_argument(
+        "--backend", choices=["auto", "native", "7z"], default="auto",
+        help="Extraction backend (default: auto - native for zip/tar, 7z otherwise)",
+    )
+    parser.add_argument(
+        "--batch", action="store_true",
+        help="Batch mode for a single archive (implied by --dir or several archives)",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=DEFAULT_BATCH_JOBS,
+        help=f"Concurrent extractions in batch mode (default: {DEFAULT_BATCH_JOBS})",
+    )
+    parser.add_argument(
+        "--max-depth", type=int, default=DEFAULT_MAX_DEPTH,
+        help=f"Nested archive depth in batch mode, 0 = none (default: {DEFAULT_MAX_DEPTH})",
+    )
     parser.add_argument(
         "-q", "--quiet", action="store_true", help="Suppress progress output"
     )
 
     args = parser.parse_args()
 
-    if not args.archive:
-        parser.print_help()
+    if args.selective and detect_by_extension is None:
+        parser.error("--selective needs the sibling file-router skill (skills/file-router)")
+
+    archives = list(args.archives)
+    if args.dir:
+        archives.extend(find_archives(args.dir))
+
+    if not archives:
+        if args.dir:
+            print(f"No archives found in {args.dir}", file=sys.stderr)
+        else:
+            parser.print_help()
         return 1
 
+    # Batch mode
+    if args.dir or args.batch or len(archives) > 1:
+        batch = extract_batch(
+            archives,
+            output_dir=args.output,
+            jobs=args.jobs,
+            max_depth=args.max_depth,
+            quiet=args.quiet,
+            password=args.password,
+            flat=args.flat,
+            overwrite=args.overwrite,
+            backend=args.backend,
+            selective=args.selective,
+        )
+        if args.json:
+            print(json.dumps(batch, indent=2))
+        else:
+            print(format_batch_human_readable(batch))
+        return 0 if batch["status"] == "success" else 1
+
     result = extract_archive(
-        args.archive,
+        archives[0],
         output_dir=args.output,
         password=args.password,
         flat=args.flat,
         overwrite=args.overwrite,
         quiet=args.quiet,
+        backend=args.backend,
+        selective=args.selective,
     )
 
     if args.json:
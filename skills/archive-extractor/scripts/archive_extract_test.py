@@ -0,0 +1,81 @@
+import shutil
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from archive_extract import extract_archive
+
+
+def corrupt_member_data(path, marker):
+    """Overwrite the compressed bytes that follow a member's local header."""
+    data = bytearray(Path(path).read_bytes())
+    start = data.find(marker) + len(marker)
+    data[start:start + 64] = b"\xff" * 64
+    Path(path).write_bytes(bytes(data))
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestNativeExtractionErrors(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.payload = "lecture notes " * 2000
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_corrupt_deflate_stream(self):
+        """Test that a zip member with a corrupt deflate stream returns an error dict"""
+        path = self.tmpdir / "corrupt.zip"
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("notes.txt", self.payload)
+        corrupt_member_data(path, b"notes.txt")
+
+        result = extract_archive(str(path), str(self.tmpdir / "out"), quiet=True,
+                                 backend="native")
+        self.assertIn("error", result)
+        self.assertEqual(result["source"], str(path.absolute()))
+
+    def test_truncated_zip_member(self):
+        """Test that a zip cut off inside a member returns an error dict"""
+        path = self.tmpdir / "truncated.zip"
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("notes.txt", self.payload)
+        data = path.read_bytes()
+        path.write_bytes(data[: len(data) // 3])
+
+        result = extract_archive(str(path), str(self.tmpdir / "out"), quiet=True,
+                                 backend="native")
+        self.assertIn("error", result)
+
+    def test_corrupt_xz_tar(self):
+        """Test that a corrupt xz stream returns an error dict"""
+        src = self.tmpdir / "notes.txt"
+        src.write_text(self.payload)
+        path = self.tmpdir / "corrupt.tar.xz"
+        with tarfile.open(path, "w:xz") as tf:
+            tf.add(src, arcname="notes.txt")
+        data = bytearray(path.read_bytes())
+        data[64:128] = b"\xff" * 64
+        path.write_bytes(bytes(data))
+
+        result = extract_archive(str(path), str(self.tmpdir / "out"), quiet=True,
+                                 backend="native")
+        self.assertIn("error", result)
+
+    def test_valid_zip(self):
+        """Test that an intact zip still extracts"""
+        path = self.tmpdir / "ok.zip"
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("notes.txt", self.payload)
+
+        result = extract_archive(str(path), str(self.tmpdir / "out"), quiet=True,
+                                 backend="native")
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["file_count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+SQLite Export Benchmark - Measure peak memory and throughput of table exports.
+
+Generates a SQLite database of the requested size (or uses an existing one)
+and exports its largest table once per format, each in a fresh process so
+peak RSS is measured per format.
+
+Usage:
+    python benchmark_extract.py [OPTIONS]
+    python benchmark_extract.py --database large.db --table events [OPTIONS]
+"""
+
+import argparse
+import json
+import os
+import resource
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+# Bytes per generated row (payload text plus a few numeric columns)
+PAYLOAD_SIZE = 480
+BENCH_TABLE = "events"
+
+
+def generate_database(db_path: Path, size_gb: float) -> int:
+    """Write a single-table database of roughly size_gb gigabytes."""
+    rows = max(1, int(size_gb * 1024 ** 3 / (PAYLOAD_SIZE + 32)))
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute(
+        f"CREATE TABLE {BENCH_TABLE} "
+        "(id INTEGER PRIMARY KEY, user_id INTEGER, score REAL, payload TEXT)"
+    )
+    payload = "x" * PAYLOAD_SIZE
+    conn.executemany(
+        f"INSERT INTO {BENCH_TABLE} VALUES (?, ?, ?, ?)",
+        ((i, i % 9973, i / 7, payload) for i in range(rows)),
+    )
+    conn.commit()
+    conn.close()
+    return rows
+
+
+def largest_table(db_path: str) -> str:
+    """Name of the table with the most rows."""
+    from db_extract import get_connection, get_row_count, get_tables
+
+    conn = get_connection(db_path)
+    try:
+        return max(get_tables(conn), key=lambda t: get_row_count(conn, t))
+    finally:
+        conn.close()
+
+
+def run_child(db_path: str, table: str, fmt: str, output_dir: str) -> dict:
+    """Export one table in this process and report time and peak RSS."""
+    from db_extract import (
+        export_to_csv,
+        export_to_json,
+        export_to_markdown,
+        export_to_ndjson,
+        export_table,
+        get_connection,
+        get_row_count,
+    )
+
+    exporters = {
+        "csv": export_to_csv,
+        "json": export_to_json,
+        "ndjson": export_to_ndjson,
+        "markdown": export_to_markdown,
+    }
+
+    conn = get_connection(db_path)
+    rows = get_row_count(conn, table)
+
+    start = time.perf_counter()
+    if fmt == "all":
+        # Single scan feeding csv, json and markdown together
+        targets = {}
+        for name in ("csv", "json", "markdown"):
+            targets[name] = Path(output_dir) / name
+            targets[name].mkdir(exist_ok=True)
+        export_table(conn, table, targets)
+        output_files = [targets[name] / f"{table}{ext}" for name, ext in
+                        (("csv", ".csv"), ("json", ".json"), ("markdown", ".md"))]
+    else:
+        output_files = [exporters[fmt](conn, table, Path(output_dir))]
+    elapsed = time.perf_counter() - start
+    conn.close()
+
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+    return {
+        "format": fmt,
+        "rows": rows,
+        "seconds": round(elapsed, 2),
+        "rows_per_sec": round(rows / elapsed, 1) if elapsed else 0.0,
+        "peak_rss_mb": round(peak_mb, 1),
+        "output_mb": round(sum(os.path.getsize(f) for f in output_files) / (1024 * 1024), 1),
+    }
+
+
+def run_format(db_path: str, table: str, fmt: str, output_dir: str) -> dict:
+    """Run one export in a fresh interpreter so peak RSS isn't shared."""
+    proc = subprocess.run(
+        [sys.executable, __file__, "--child", fmt, "--database", db_path,
+         "--table", table, "-o", output_dir],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        return {"format": fmt, "error": proc.stderr.strip()}
+    return json.loads(proc.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="SQLite Export Benchmark - Peak RSS and rows/sec per export format"
+    )
+    parser.add_argument("--database", help="Existing database (default: generate one)")
+    parser.add_argument("--table", help="Table to export (default: largest table)")
+    parser.add_argument(
+        "--size-gb", type=float, default=2.0,
+        help="Size of the generated database in GB (default: 2.0)",
+    )
+    parser.add_argument(
+        "-f", "--formats", default="csv,json,ndjson,markdown,all",
+        help="Comma-separated formats; all = single-scan csv+json+markdown "
+             "(default: csv,json,ndjson,markdown,all)",
+    )
+    parser.add_argument("-o", "--output", help="Output directory (default: temporary)")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("-j", "--json", action="store_true", help="Output as JSON")
+
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args.database, args.table, args.child, args.output)))
+        return 0
+
+    with tempfile.TemporaryDirectory(prefix="sqlite_bench_") as tmp:
+        db_path = args.database
+        if not db_path:
+            db_path = str(Path(tmp) / "bench.db")
+            print(f"Generating {args.size_gb} GB database...", file=sys.stderr)
+            generate_database(Path(db_path), args.size_gb)
+
+        table = args.table or largest_table(db_path)
+        output_dir = args.output or tmp
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+        results = [
+            run_format(db_path, table, fmt, output_dir)
+            for fmt in args.formats.split(",")
+        ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'Format':<10} {'Rows':>10} {'Seconds':>9} {'Rows/sec':>11} {'Peak MB':>8} {'Out MB':>8}")
+        for r in results:
+            if "error" in r:
+                print(f"{r['format']:<10} Error: {r['error']}")
+                continue
+            print(
+                f"{r['format']:<10} {r['rows']:>10} {r['seconds']:>9.2f} "
+                f"{r['rows_per_sec']:>11.1f} {r['peak_rss_mb']:>8.1f} {r['output_mb']:>8.1f}"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,22 +11,67 @@ Usage:
     python db_extract.py database.db                    # Extract all to CSV
     python db_extract.py database.db -o ./output        # Specify output dir
     python db_extract.py database.db -f json            # Output as JSON
+    python db_extract.py database.db -f ndjson          # Output as JSON lines
     python db_extract.py database.db -f markdown        # Output as Markdown tables
+    python db_extract.py database.db -f markdown --sample random  # Sampled previews
+    python db_extract.py database.db -f parquet         # Output as Parquet (needs pyarrow)
     python db_extract.py database.db --tables users,posts  # Specific tables only
     python db_extract.py database.db --schema           # Include schema info
+    python db_extract.py database.db -f all --jobs 4    # Export tables in parallel
+    python db_extract.py database.db --resume           # Skip tables already exported
 """
 
 import argparse
 import csv
+import hashlib
 import json
+import os
+import random
 import sqlite3
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
 
-def get_connection(db_path: str):
-    """Create database connection. Supports SQLite and basic URI formats."""
+
+# Rows fetched per round trip; exports hold at most one batch in memory
+FETCH_BATCH_SIZE = 1000
+
+# Rows per Arrow record batch / Parquet row group
+ARROW_BATCH_ROWS = 64 * 1024
+
+# Columnar formats; without pyarrow they fall back to NDJSON
+COLUMNAR_FORMATS = ("parquet", "arrow")
+
+# Checkpoint manifest in the output directory, and formats new rows can be appended to
+MANIFEST_FILENAME = "_manifest.json"
+APPENDABLE_FORMATS = ("csv", "ndjson")
+
+# Markdown preview sampling
+SAMPLE_MODES = ("head", "random", "stratified")
+SAMPLE_ROUNDS = 4  # random seeks per wanted row before giving up on duplicates
+
+# Bulk-read tuning for export connections
+MMAP_SIZE = 256 * 1024 * 1024
+CACHE_SIZE_KB = 64 * 1024
+
+
+def get_connection(db_path: str, read_only: bool = False, immutable: bool = False):
+    """
+    Create database connection. Supports SQLite and basic URI formats.
+
+    read_only opens the file with a mode=ro URI. immutable additionally tells
+    SQLite the file cannot change (no locking or change detection); it is
+    ignored when a -wal or -journal file shows the database is in use.
+    """
     path = Path(db_path)
     
     # Handle SQLite URI format
@@ -37,11 +82,26 @@ def get_connection(db_path: str):
     if not path.exists():
         raise FileNotFoundError(f"Database not found: {path}")
     
-    conn = sqlite3.connect(str(path))
+    if read_only:
+        uri = path.resolve().as_uri() + "?mode=ro"
+        if immutable and is_quiescent(path):
+            uri += "&immutable=1"
+        conn = sqlite3.connect(uri, uri=True)
+        conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        conn.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KB}")
+    else:
+        conn = sqlite3.connect(str(path))
     conn.row_factory = sqlite3.Row
     return conn
 
 
+def is_quiescent(path: Path) -> bool:
+    """True if no write-ahead log or rollback journal sits next to the database."""
+    return not any(
+        path.with_name(path.name + suffix).exists() for suffix in ("-wal", "-journal")
+    )
+
+
 def get_tables(conn) -> list[str]:
     """Get list of all tables in database."""
     cursor = conn.execute(
@@ -70,85 +130,593 @@ def get_row_count(conn, table: str) -> int:
     return cursor.fetchone()[0]
 
 
-def export_to_csv(conn, table: str, output_dir: Path) -> Path:
-    """Export table to CSV file."""
-    output_file = output_dir / f"{table}.csv"
-    
-    cursor = conn.execute(f"SELECT * FROM '{table}'")
-    columns = [desc[0] for desc in cursor.description]
-    rows = cursor.fetchall()
-    
-    with open(output_file, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(columns)
-        writer.writerows(rows)
-    
-    return output_file
+def estimate_row_count(conn, table: str) -> Optional[int]:
+    """
+    Approximate row count without scanning the table.
 
+    Uses sqlite_stat1 (written by ANALYZE) when present, otherwise the
+    largest rowid, which overcounts after deletes. Returns None for
+    WITHOUT ROWID tables that have no statistics.
+    """
+    try:
+        row = conn.execute(
+            "SELECT MAX(CAST(stat AS INTEGER)) FROM sqlite_stat1 WHERE tbl = ?", (table,)
+        ).fetchone()
+        if row and row[0] is not None:
+            return row[0]
+    except sqlite3.OperationalError:
+        pass  # No ANALYZE statistics
+    try:
+        return conn.execute(f"SELECT MAX(rowid) FROM '{table}'").fetchone()[0] or 0
+    except sqlite3.OperationalError:
+        return None
 
-def export_to_json(conn, table: str, output_dir: Path) -> Path:
-    """Export table to JSON file."""
-    output_file = output_dir / f"{table}.json"
-    
-    cursor = conn.execute(f"SELECT * FROM '{table}'")
-    columns = [desc[0] for desc in cursor.description]
-    rows = cursor.fetchall()
-    
-    data = [dict(zip(columns, row)) for row in rows]
-    
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, default=str)
-    
-    return output_file
 
+def format_row_count(conn, table: str, row_counts: dict, exact: bool = False) -> str:
+    """Row count for reports: known counts as-is, otherwise exact or labelled estimate."""
+    if table in row_counts:
+        return str(row_counts[table])
+    if not exact:
+        estimate = estimate_row_count(conn, table)
+        if estimate is not None:
+            return f"~{estimate} (estimate)"
+    return str(get_row_count(conn, table))
 
-def export_to_markdown(conn, table: str, output_dir: Path, max_rows: int = 100) -> Path:
-    """Export table to Markdown file with table format."""
-    output_file = output_dir / f"{table}.md"
-    
-    cursor = conn.execute(f"SELECT * FROM '{table}'")
-    columns = [desc[0] for desc in cursor.description]
-    rows = cursor.fetchall()
-    
-    total_rows = len(rows)
-    display_rows = rows[:max_rows]
-    
+
+def iter_batches(cursor, batch_size: int = FETCH_BATCH_SIZE):
+    """Yield lists of rows from a cursor, batch_size at a time."""
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        yield rows
+
+
+def render_markdown(table: str, columns: list[str], rows: list, row_count,
+                    note: Optional[str] = None) -> str:
+    """Markdown document for a table: row count, optional note and the given rows."""
     lines = [f"# {table}", ""]
     
     # Add row count info
-    lines.append(f"**Rows:** {total_rows}")
-    if total_rows > max_rows:
-        lines.append(f"*(showing first {max_rows} rows)*")
+    lines.append(f"**Rows:** {row_count}")
+    if note:
+        lines.append(f"*({note})*")
     lines.append("")
     
     # Create markdown table
-    if columns and display_rows:
+    if columns and rows:
         # Header
         lines.append("| " + " | ".join(columns) + " |")
         lines.append("| " + " | ".join(["---"] * len(columns)) + " |")
         
         # Rows
-        for row in display_rows:
+        for row in rows:
             cells = [str(cell).replace("|", "\\|").replace("\n", " ")[:100] for cell in row]
             lines.append("| " + " | ".join(cells) + " |")
     else:
         lines.append("*Empty table*")
     
+    return "\n".join(lines)
+
+
+class TableWriter:
+    """Base for per-format writers fed row batches by export_table."""
+
+    suffix = ""
+    f = None
+
+    def write(self, rows: list) -> None:
+        raise NotImplementedError
+
+    def close(self, total_rows: int) -> None:
+        self.f.close()
+
+    def abort(self) -> None:
+        """Release the output file after a failed scan."""
+        if self.f is not None:
+            self.f.close()
+
+
+class CsvWriter(TableWriter):
+    """Writes rows to <table>.csv as they arrive."""
+
+    suffix = ".csv"
+
+    def __init__(self, output_file: Path, columns: list[str], append: bool = False):
+        self.output_file = output_file
+        self.f = open(output_file, "a" if append else "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.f)
+        if not append:
+            self.writer.writerow(columns)
+
+    def write(self, rows: list) -> None:
+        self.writer.writerows(rows)
+
+
+class JsonWriter(TableWriter):
+    """Writes rows to <table>.json as an array, one record at a time."""
+
+    suffix = ".json"
+
+    def __init__(self, output_file: Path, columns: list[str]):
+        self.output_file = output_file
+        self.columns = columns
+        self.f = open(output_file, "w", encoding="utf-8")
+        self.separator = "[\n"
+
+    def write(self, rows: list) -> None:
+        # Same layout as json.dump(rows, indent=2) without building the list
+        for row in rows:
+            record = json.dumps(dict(zip(self.columns, row)), indent=2, default=str)
+            self.f.write(self.separator + "  " + record.replace("\n", "\n  "))
+            self.separator = ",\n"
+
+    def close(self, total_rows: int) -> None:
+        self.f.write("[]" if self.separator == "[\n" else "\n]")
+        self.f.close()
+
+
+class NdjsonWriter(TableWriter):
+    """Writes rows to <table>.ndjson, one record per line."""
+
+    suffix = ".ndjson"
+
+    def __init__(self, output_file: Path, columns: list[str], append: bool = False):
+        self.output_file = output_file
+        self.columns = columns
+        self.f = open(output_file, "a" if append else "w", encoding="utf-8")
+
+    def write(self, rows: list) -> None:
+        self.f.writelines(
+            json.dumps(dict(zip(self.columns, row)), default=str) + "\n" for row in rows
+        )
+
+
+class MarkdownWriter(TableWriter):
+    """Keeps the first max_rows rows and writes <table>.md once the total is known."""
+
+    suffix = ".md"
+
+    def __init__(self, output_file: Path, columns: list[str], table: str, max_rows: int = 100):
+        self.output_file = output_file
+        self.columns = columns
+        self.table = table
+        self.max_rows = max_rows
+        self.display_rows = []
+
+    def write(self, rows: list) -> None:
+        room = self.max_rows - len(self.display_rows)
+        if room > 0:
+            self.display_rows.extend(rows[:room])
+
+    def close(self, total_rows: int) -> None:
+        note = f"showing first {self.max_rows} rows" if total_rows > self.max_rows else None
+        with open(self.output_file, "w", encoding="utf-8") as f:
+            f.write(render_markdown(self.table, self.columns, self.display_rows, total_rows, note))
+
+
+def arrow_type(declared: str):
+    """Arrow type for a SQLite declared column type, following SQLite's affinity rules."""
+    declared = (declared or "").upper()
+    if "INT" in declared:
+        return pa.int64()
+    if any(t in declared for t in ("CHAR", "CLOB", "TEXT")):
+        return pa.string()
+    if "BLOB" in declared:
+        return pa.binary()
+    if any(t in declared for t in ("REAL", "FLOA", "DOUB")):
+        return pa.float64()
+    # NUMERIC affinity and untyped columns hold mixed values; keep them as text
+    return pa.string()
+
+
+def coerce_value(value, arrow_type_):
+    """Convert a value that doesn't match its column type, or None if it can't be."""
+    if value is None:
+        return None
+    try:
+        if pa.types.is_integer(arrow_type_):
+            return int(value)
+        if pa.types.is_floating(arrow_type_):
+            return float(value)
+        if pa.types.is_binary(arrow_type_):
+            return value if isinstance(value, bytes) else str(value).encode("utf-8")
+    except (TypeError, ValueError):
+        return None
+    return value.hex() if isinstance(value, bytes) else str(value)
+
+
+def to_arrow_array(values: list, arrow_type_):
+    """Build a typed column, coercing stray values (SQLite columns aren't strictly typed)."""
+    try:
+        return pa.array(values, type=arrow_type_)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError, TypeError):
+        return pa.array([coerce_value(v, arrow_type_) for v in values], type=arrow_type_)
+
+
+class ColumnarWriter(TableWriter):
+    """Writes rows to Parquet or Arrow IPC in record batches of ARROW_BATCH_ROWS."""
+
+    def __init__(self, output_file: Path, columns: list[str], schema: list[dict]):
+        self.output_file = output_file
+        declared = {col["name"]: col["type"] for col in schema}
+        self.schema = pa.schema([(name, arrow_type(declared.get(name))) for name in columns])
+        self.pending = []
+        self.writer = self.open_writer()
+
+    def open_writer(self):
+        raise NotImplementedError
+
+    def write(self, rows: list) -> None:
+        self.pending.extend(rows)
+        if len(self.pending) >= ARROW_BATCH_ROWS:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        arrays = [
+            to_arrow_array([row[i] for row in self.pending], field.type)
+            for i, field in enumerate(self.schema)
+        ]
+        self.writer.write_batch(pa.record_batch(arrays, schema=self.schema))
+        self.pending = []
+
+    def close(self, total_rows: int) -> None:
+        self.flush()
+        self.writer.close()
+
+    def abort(self) -> None:
+        self.writer.close()
+
+
+class ParquetWriter(ColumnarWriter):
+    """Writes rows to <table>.parquet."""
+
+    suffix = ".parquet"
+
+    def open_writer(self):
+        return pq.ParquetWriter(str(self.output_file), self.schema, compression="zstd")
+
+
+class ArrowIpcWriter(ColumnarWriter):
+    """Writes rows to <table>.arrow (Arrow IPC file format)."""
+
+    suffix = ".arrow"
+
+    def open_writer(self):
+        return pa.ipc.new_file(str(self.output_file), self.schema)
+
+
+WRITERS = {
+    "csv": CsvWriter,
+    "json": JsonWriter,
+    "ndjson": NdjsonWriter,
+    "markdown": MarkdownWriter,
+    "parquet": ParquetWriter,
+    "arrow": ArrowIpcWriter,
+}
+
+
+def export_table(conn, table: str, targets: dict, max_rows: int = 100,
+                 where: str = "", params: tuple = (), append: bool = False) -> int:
+    """
+    Export a table to several formats with a single scan.
+
+    targets maps format name to output directory. Every row batch read from
+    the cursor is handed to each format's writer in turn. where/params limit
+    the rows exported; append adds them to existing CSV/NDJSON files.
+    Returns the number of rows exported.
+    """
+    query = f"SELECT * FROM '{table}'" + (f" WHERE {where}" if where else "")
+    cursor = conn.execute(query, params)
+    columns = [desc[0] for desc in cursor.description]
+    
+    writers = []
+    try:
+        for fmt, output_dir in targets.items():
+            writer_cls = WRITERS[fmt]
+            output_file = output_dir / f"{table}{writer_cls.suffix}"
+            if writer_cls is MarkdownWriter:
+                writers.append(MarkdownWriter(output_file, columns, table, max_rows))
+            elif issubclass(writer_cls, ColumnarWriter):
+                writers.append(writer_cls(output_file, columns, get_schema(conn, table)))
+            elif append:
+                writers.append(writer_cls(output_file, columns, append=True))
+            else:
+                writers.append(writer_cls(output_file, columns))
+        
+        total_rows = 0
+        for rows in iter_batches(cursor):
+            total_rows += len(rows)
+            for writer in writers:
+                writer.write(rows)
+    except BaseException:
+        for writer in writers:
+            writer.abort()
+        raise
+    
+    for writer in writers:
+        writer.close(total_rows)
+    
+    return total_rows
+
+
+# Per-process connection for parallel exports
+_worker_conn = None
+
+
+def _init_worker(db_path: str, immutable: bool) -> None:
+    """Open this worker's read-only connection."""
+    global _worker_conn
+    _worker_conn = get_connection(db_path, read_only=True, immutable=immutable)
+
+
+def _export_worker(table: str, targets: dict, max_rows: int, where: str,
+                   params: tuple, append: bool) -> tuple:
+    """Export one table on this worker's connection."""
+    return table, export_table(_worker_conn, table, targets, max_rows, where, params, append)
+
+
+def export_tables_parallel(
+    db_path: str,
+    tables: list[str],
+    targets: dict,
+    max_rows: int = 100,
+    jobs: int = 4,
+    immutable: bool = False,
+    plans: Optional[dict] = None,
+    on_done=None,
+) -> dict:
+    """
+    Export tables concurrently, one read-only connection per worker process.
+
+    plans optionally maps table to a plan_export result. Returns
+    {table: rows_exported}. on_done(table, rows), if given, is called in this
+    process as each table finishes.
+    """
+    plans = plans or {}
+    row_counts = {}
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(db_path, immutable)
+    ) as executor:
+        futures = []
+        for table in tables:
+            plan = plans.get(table, {})
+            futures.append(executor.submit(
+                _export_worker, table, targets, max_rows,
+                plan.get("where", ""), plan.get("params", ()), plan.get("append", False),
+            ))
+        for future in as_completed(futures):
+            table, count = future.result()
+            row_counts[table] = count
+            if on_done:
+                on_done(table, count)
+    return row_counts
+
+
+def export_to_csv(conn, table: str, output_dir: Path) -> Path:
+    """Export table to CSV file."""
+    export_table(conn, table, {"csv": output_dir})
+    return output_dir / f"{table}.csv"
+
+
+def export_to_json(conn, table: str, output_dir: Path) -> Path:
+    """Export table to JSON file."""
+    export_table(conn, table, {"json": output_dir})
+    return output_dir / f"{table}.json"
+
+
+def export_to_ndjson(conn, table: str, output_dir: Path) -> Path:
+    """Export table to newline-delimited JSON (one record per line)."""
+    export_table(conn, table, {"ndjson": output_dir})
+    return output_dir / f"{table}.ndjson"
+
+
+def export_to_markdown(conn, table: str, output_dir: Path, max_rows: int = 100) -> Path:
+    """Export table to Markdown file with table format."""
+    export_table(conn, table, {"markdown": output_dir}, max_rows)
+    return output_dir / f"{table}.md"
+
+
+def export_to_parquet(conn, table: str, output_dir: Path) -> Path:
+    """Export table to Parquet with column types from the schema (requires pyarrow)."""
+    export_table(conn, table, {"parquet": output_dir})
+    return output_dir / f"{table}.parquet"
+
+
+def export_to_arrow(conn, table: str, output_dir: Path) -> Path:
+    """Export table to an Arrow IPC file with column types from the schema (requires pyarrow)."""
+    export_table(conn, table, {"arrow": output_dir})
+    return output_dir / f"{table}.arrow"
+
+
+def integer_primary_key(schema: list[dict]) -> Optional[str]:
+    """
+    Name of the primary key if it is a rowid alias, else None.
+
+    Only a single column declared exactly INTEGER aliases the rowid; other
+    INT-typed keys (INT, BIGINT, ...) are ordinary columns that may hold NULL.
+    """
+    pk_columns = [col for col in schema if col["primary_key"]]
+    if len(pk_columns) == 1 and (pk_columns[0]["type"] or "").strip().upper() == "INTEGER":
+        return pk_columns[0]["name"]
+    return None
+
+
+def schema_hash(schema: list[dict]) -> str:
+    """Stable hash of a table's column definitions."""
+    payload = json.dumps(schema, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def load_manifest(output_dir: Path) -> dict:
+    """Read the checkpoint manifest, or start an empty one."""
+    try:
+        with open(output_dir / MANIFEST_FILENAME, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if isinstance(manifest.get("tables"), dict):
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {"tables": {}}
+
+
+def save_manifest(output_dir: Path, manifest: dict) -> None:
+    """Write the checkpoint manifest atomically."""
+    path = output_dir / MANIFEST_FILENAME
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, path)
+
+
+def plan_export(conn, table: str, formats: list[str], entry: Optional[dict],
+                resume: bool = False, incremental: bool = False) -> Optional[dict]:
+    """
+    Decide how to export a table given its checkpoint entry.
+
+    Returns None when the checkpoint is current (same schema hash, formats,
+    row count and max key). Otherwise returns a plan with the WHERE clause to
+    export and the values to record once it completes. With resume, tables
+    keyed by a rowid alias are bounded by the max key read here, so the
+    checkpoint matches what was written. With incremental, a table whose key
+    has grown only gets rows past the checkpointed key, appended to its
+    CSV/NDJSON files.
+    """
+    schema = get_schema(conn, table)
+    key = integer_primary_key(schema)
+    plan = {
+        "schema_hash": schema_hash(schema),
+        "max_key": None,
+        "where": "",
+        "params": (),
+        "append": False,
+        "base_rows": 0,
+    }
+    if key:
+        plan["max_key"] = conn.execute(f"SELECT MAX(\"{key}\") FROM '{table}'").fetchone()[0]
+        if plan["max_key"] is not None and (resume or incremental):
+            plan["where"] = f"\"{key}\" <= ?"
+            plan["params"] = (plan["max_key"],)
+
+    if not entry or entry.get("schema_hash") != plan["schema_hash"]:
+        return plan
+    if sorted(formats) != entry.get("formats"):
+        return plan
+
+    old_key = entry.get("max_key")
+    if (incremental and key and old_key is not None and plan["max_key"] is not None
+            and plan["max_key"] > old_key and set(formats) <= set(APPENDABLE_FORMATS)):
+        plan["where"] = f"\"{key}\" > ? AND \"{key}\" <= ?"
+        plan["params"] = (old_key, plan["max_key"])
+        plan["append"] = True
+        plan["base_rows"] = entry.get("rows", 0)
+        return plan
+
+    if plan["max_key"] == old_key and get_row_count(conn, table) == entry.get("rows"):
+        return None
+    return plan
+
+
+def record_checkpoint(manifest: dict, table: str, plan: dict, rows: int,
+                      formats: list[str]) -> int:
+    """Record a completed table in the manifest; returns its total row count."""
+    total = plan["base_rows"] + rows
+    manifest["tables"][table] = {
+        "rows": total,
+        "schema_hash": plan["schema_hash"],
+        "max_key": plan["max_key"],
+        "formats": sorted(formats),
+        "completed_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    return total
+
+
+def sample_rows(conn, table: str, max_rows: int = 100, sample: str = "head") -> tuple:
+    """
+    Read up to max_rows preview rows without scanning the table.
+
+    head takes the first rows (LIMIT). random seeks to random rowids between
+    MIN(rowid) and MAX(rowid). stratified seeks to max_rows evenly spaced
+    rowids. Each seek is one index lookup, so cost does not depend on table
+    size. Rows after large rowid gaps are favoured, and both modes fall back
+    to head for small and WITHOUT ROWID tables. Returns (columns, rows, note).
+    """
+    cursor = conn.execute(f"SELECT * FROM '{table}' LIMIT ?", (max_rows + 1,))
+    columns = [desc[0] for desc in cursor.description]
+    
+    if sample != "head":
+        try:
+            lo, hi = conn.execute(f"SELECT MIN(rowid), MAX(rowid) FROM '{table}'").fetchone()
+        except sqlite3.OperationalError:
+            lo = hi = None  # WITHOUT ROWID
+        if lo is not None and hi - lo + 1 > max_rows:
+            if sample == "random":
+                rng = random.Random()
+                keys = (rng.randint(lo, hi) for _ in range(SAMPLE_ROUNDS * max_rows))
+                rows = _seek_rows(conn, table, keys, max_rows)
+                return columns, rows, f"showing {len(rows)} randomly sampled rows"
+            step = (hi - lo + 1) / max_rows
+            keys = (lo + int(i * step) for i in range(max_rows))
+            rows = _seek_rows(conn, table, keys, max_rows)
+            return columns, rows, f"showing {len(rows)} rows sampled evenly across the table"
+    
+    rows = cursor.fetchall()
+    note = f"showing first {max_rows} rows" if len(rows) > max_rows else None
+    return columns, rows[:max_rows], note
+
+
+def _seek_rows(conn, table: str, keys, max_rows: int) -> list:
+    """First row at or after each rowid in keys, deduplicated, in rowid order."""
+    found = {}
+    for key in keys:
+        row = conn.execute(
+            f"SELECT rowid, * FROM '{table}' WHERE rowid >= ? ORDER BY rowid LIMIT 1", (key,)
+        ).fetchone()
+        if row is not None:
+            found.setdefault(row[0], tuple(row)[1:])
+            if len(found) >= max_rows:
+                break
+    return [found[key] for key in sorted(found)]
+
+
+def export_markdown_preview(conn, table: str, output_dir: Path, max_rows: int = 100,
+                            sample: str = "head", row_count: Optional[str] = None) -> Path:
+    """
+    Export a Markdown preview of a table without reading all of it.
+
+    row_count is the count to display. When it is not given, an estimate
+    is used (see format_row_count).
+    """
+    output_file = output_dir / f"{table}.md"
+    columns, rows, note = sample_rows(conn, table, max_rows, sample)
+    if row_count is None:
+        row_count = format_row_count(conn, table, {})
+    
     with open(output_file, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        f.write(render_markdown(table, columns, rows, row_count, note))
     
     return output_file
 
 
-def export_schema_info(conn, tables: list[str], output_dir: Path) -> Path:
-    """Export database schema as Markdown documentation."""
+def export_schema_info(
+    conn, tables: list[str], output_dir: Path, row_counts: Optional[dict] = None,
+    exact_counts: bool = False,
+) -> Path:
+    """Export database schema as Markdown documentation.
+
+    row_counts, when given, supplies counts already gathered during export.
+    Other tables get estimated counts unless exact_counts is set.
+    """
     output_file = output_dir / "_schema.md"
+    row_counts = row_counts or {}
     
     lines = ["# Database Schema", ""]
     
     for table in tables:
         schema = get_schema(conn, table)
-        row_count = get_row_count(conn, table)
+        row_count = format_row_count(conn, table, row_counts, exact_counts)
         
         lines.append(f"## {table}")
         lines.append(f"**Rows:** {row_count}")
@@ -181,17 +749,38 @@ Examples:
   # Extract to JSON format
   python db_extract.py course.db -f json
 
+  # Extract to JSON lines (one record per line)
+  python db_extract.py course.db -f ndjson
+
   # Extract to Markdown tables (good for LLM context)
   python db_extract.py course.db -f markdown
 
+  # Markdown previews of random rows, without reading whole tables
+  python db_extract.py course.db -f markdown --sample random
+
+  # Extract to typed Parquet for analysis tools (needs pyarrow)
+  python db_extract.py course.db -f parquet
+
   # Extract specific tables only
   python db_extract.py course.db --tables lessons,quizzes
 
   # Include schema documentation
   python db_extract.py course.db --schema
 
+  # Schema documentation only, with estimated row counts
+  python db_extract.py course.db --schema-only
+
   # All formats at once
   python db_extract.py course.db -f all --schema
+
+  # Export 8 tables at a time
+  python db_extract.py course.db -f all --jobs 8
+
+  # Rerun after a failure, skipping tables already exported
+  python db_extract.py course.db -f all --resume
+
+  # Append rows added since the last run (integer primary keys)
+  python db_extract.py course.db -f ndjson --incremental
         """
     )
     
@@ -199,7 +788,7 @@ Examples:
     parser.add_argument("-o", "--output", default="./extracted",
                         help="Output directory (default: ./extracted)")
     parser.add_argument("-f", "--format", 
-                        choices=["csv", "json", "markdown", "all"],
+                        choices=["csv", "json", "ndjson", "markdown", "parquet", "arrow", "all"],
                         default="csv",
                         help="Output format (default: csv)")
     parser.add_argument("--tables", 
@@ -210,6 +799,24 @@ Examples:
                         help="Also export schema documentation")
     parser.add_argument("--max-rows", type=int, default=100,
                         help="Max rows for markdown format (default: 100)")
+    parser.add_argument("--sample", choices=SAMPLE_MODES, default="head",
+                        help="Markdown preview rows: head, random or stratified "
+                             "(default: head)")
+    parser.add_argument("--schema-only", action="store_true",
+                        help="Only write _schema.md; row counts are estimates")
+    parser.add_argument("--exact-counts", action="store_true",
+                        help="Use COUNT(*) where row counts would otherwise be estimated")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Tables exported in parallel (default: 1)")
+    parser.add_argument("--immutable", action="store_true",
+                        help="Treat the database file as unchanging (skips locking; "
+                             "only for files nothing else is writing)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Skip tables the checkpoint manifest shows are already "
+                             "exported and unchanged")
+    parser.add_argument("--incremental", action="store_true",
+                        help="With a checkpoint, append only rows past the last exported "
+                             "integer primary key (csv/ndjson; implies --resume)")
     parser.add_argument("-q", "--quiet", action="store_true",
                         help="Suppress progress output")
     
@@ -222,7 +829,7 @@ Examples:
     try:
         # Connect to database
         log(f"Opening: {args.database}")
-        conn = get_connection(args.database)
+        conn = get_connection(args.database, read_only=True, immutable=args.immutable)
         
         # Get tables
         all_tables = get_tables(conn)
@@ -247,31 +854,82 @@ Examples:
         output_dir = Path(args.output)
         output_dir.mkdir(parents=True, exist_ok=True)
         
+        if args.schema_only:
+            schema_file = export_schema_info(
+                conn, tables, output_dir, exact_counts=args.exact_counts
+            )
+            log(f"  Schema → {schema_file}")
+            conn.close()
+            return
+        
         # Determine formats to export
         formats = ["csv", "json", "markdown"] if args.format == "all" else [args.format]
+        if pa is None and formats[0] in COLUMNAR_FORMATS:
+            print(f"WARNING: pyarrow not installed, writing ndjson instead of {formats[0]}",
+                  file=sys.stderr)
+            print("Install with: pip install pyarrow", file=sys.stderr)
+            formats = ["ndjson"]
         
-        # Export each table
-        for table in tables:
-            row_count = get_row_count(conn, table)
-            log(f"  {table} ({row_count} rows)")
-            
-            for fmt in formats:
-                if fmt == "csv":
-                    subdir = output_dir / "csv" if len(formats) > 1 else output_dir
-                    subdir.mkdir(exist_ok=True)
-                    export_to_csv(conn, table, subdir)
-                elif fmt == "json":
-                    subdir = output_dir / "json" if len(formats) > 1 else output_dir
-                    subdir.mkdir(exist_ok=True)
-                    export_to_json(conn, table, subdir)
-                elif fmt == "markdown":
-                    subdir = output_dir / "markdown" if len(formats) > 1 else output_dir
-                    subdir.mkdir(exist_ok=True)
-                    export_to_markdown(conn, table, subdir, args.max_rows)
+        # Export each table: one scan feeds every requested format
+        targets = {}
+        for fmt in formats:
+            subdir = output_dir / fmt if len(formats) > 1 else output_dir
+            subdir.mkdir(exist_ok=True)
+            targets[fmt] = subdir
+        
+        # Markdown rides along on the scan only when other formats need it anyway;
+        # otherwise previews come from LIMIT/sampling queries
+        preview_dir = None
+        if "markdown" in targets and (len(targets) == 1 or args.sample != "head"):
+            preview_dir = targets.pop("markdown")
+        scan_formats = list(targets)
+        
+        # Checkpoints: plan each table against the manifest from earlier runs
+        manifest = load_manifest(output_dir)
+        resume = args.resume or args.incremental
+        plans = {}
+        row_counts = {}
+        for table in tables if scan_formats else []:
+            entry = manifest["tables"].get(table) if resume else None
+            plan = plan_export(conn, table, scan_formats, entry, resume, args.incremental)
+            if plan is None:
+                row_counts[table] = entry["rows"]
+                log(f"  {table} (unchanged, skipped)")
+            else:
+                plans[table] = plan
+        pending = [table for table in tables if table in plans]
+        
+        def on_done(table, count):
+            row_counts[table] = record_checkpoint(manifest, table, plans[table], count,
+                                                  scan_formats)
+            save_manifest(output_dir, manifest)
+            added = "+" if plans[table]["append"] else ""
+            log(f"  {table} ({added}{count} rows)")
+        
+        if args.jobs > 1 and len(pending) > 1:
+            export_tables_parallel(
+                args.database, pending, targets, args.max_rows,
+                jobs=args.jobs, immutable=args.immutable, plans=plans, on_done=on_done,
+            )
+        else:
+            for table in pending:
+                plan = plans[table]
+                count = export_table(conn, table, targets, args.max_rows,
+                                     plan["where"], plan["params"], plan["append"])
+                on_done(table, count)
+        
+        if preview_dir is not None:
+            for table in tables:
+                row_count = format_row_count(conn, table, row_counts, args.exact_counts)
+                export_markdown_preview(conn, table, preview_dir, args.max_rows,
+                                        args.sample, row_count)
+                log(f"  {table} (preview: {row_count} rows)")
         
         # Export schema if requested
         if args.schema:
-            schema_file = export_schema_info(conn, tables, output_dir)
+            schema_file = export_schema_info(
+                conn, tables, output_dir, row_counts, exact_counts=args.exact_counts
+            )
             log(f"  Schema → {schema_file}")
         
         conn.close()
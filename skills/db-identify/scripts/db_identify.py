@@ -8,14 +8,19 @@ Pure identification only - no routing decisions.
 Usage:
     python db_identify.py database.file
     python db_identify.py database.file --json
+    python db_identify.py a.db b.mdb c.sqlite --ndjson
+    python db_identify.py --dir ./databases --ndjson
     python db_identify.py --list-formats
 """
 
 import argparse
 import json
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from stat import S_ISREG
+from typing import Iterable, Iterator, Optional
 
 # Database signatures: (offset, magic_bytes, format_name, version_info)
 SIGNATURES = [
@@ -67,6 +72,9 @@ EXTENSION_HINTS = {
     ".rdb": ("redis-rdb", "Redis database dump"),
 }
 
+# Batch mode: header reads in flight at once
+DEFAULT_WORKERS = 8
+
 # DBeaver CLI compatibility
 DBEAVER_SUPPORTED = {
     "sqlite": True,
@@ -143,14 +151,20 @@ def identify(filepath: str) -> dict:
     """
     path = Path(filepath)
     
-    if not path.exists():
+    # One stat call covers existence, file type and size
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
         return {"error": f"File not found: {filepath}"}
+    except PermissionError:
+        return {"error": f"Permission denied: {filepath}"}
+    except OSError as e:
+        return {"error": f"Could not read file: {e}"}
     
-    if not path.is_file():
+    if not S_ISREG(stat.st_mode):
         return {"error": f"Not a file: {filepath}"}
     
     # Get file info
-    stat = path.stat()
     file_info = {
         "path": str(path.absolute()),
         "name": path.name,
@@ -189,6 +203,50 @@ def identify(filepath: str) -> dict:
     return result
 
 
+def identify_many(filepaths: Iterable[str], workers: int = DEFAULT_WORKERS) -> Iterator[dict]:
+    """
+    Identify many files in this process, yielding results in input order.
+
+    Header reads run in a thread pool with at most workers * 4 files in
+    flight. Each result carries the input path under "input" so error
+    results can be matched back to their file.
+    """
+    def identify_one(filepath: str) -> dict:
+        return {"input": filepath, **identify(filepath)}
+
+    if workers <= 1:
+        for filepath in filepaths:
+            yield identify_one(filepath)
+        return
+
+    window = workers * 4
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for filepath in filepaths:
+            pending.append(executor.submit(identify_one, filepath))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def find_database_files(dirpath: str, recursive: bool = False) -> Iterator[str]:
+    """
+    Yield files in a directory whose names carry a known database extension.
+
+    Hidden files and anything under hidden directories (names starting with
+    ".") are skipped, as in the course scanner.
+    """
+    root = Path(dirpath)
+    pattern = "**/*" if recursive else "*"
+    for path in sorted(root.glob(pattern)):
+        if any(part.startswith(".") for part in path.relative_to(root).parts):
+            continue
+        name_lower = path.name.lower()
+        if path.is_file() and any(name_lower.endswith(ext) for ext in EXTENSION_HINTS):
+            yield str(path)
+
+
 def list_supported_formats() -> dict:
     """List all detectable database formats."""
     formats = {}
@@ -211,12 +269,22 @@ def main():
 Examples:
   python db_identify.py course.db
   python db_identify.py course.db --json
+  python db_identify.py a.db b.mdb c.sqlite --ndjson
+  python db_identify.py --dir ./databases --recursive --ndjson
   python db_identify.py --list-formats
         """
     )
     
-    parser.add_argument("database", nargs="?", help="Database file to identify")
+    parser.add_argument("database", nargs="*", help="Database file(s) to identify")
     parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
+    parser.add_argument("--ndjson", action="store_true",
+                        help="Batch mode: one JSON result per line")
+    parser.add_argument("--dir", "-d",
+                        help="Identify files with database extensions in a directory")
+    parser.add_argument("--recursive", "-r", action="store_true",
+                        help="Include subdirectories with --dir")
+    parser.add_argument("--workers", "-w", type=int, default=DEFAULT_WORKERS,
+                        help=f"Concurrent header reads in batch mode (default: {DEFAULT_WORKERS})")
     parser.add_argument("--list-formats", "-l", action="store_true", help="List detectable formats")
     
     args = parser.parse_args()
@@ -235,11 +303,35 @@ Examples:
                 print()
         return
     
-    if not args.database:
+    if not args.database and not args.dir:
         parser.print_help()
         sys.exit(1)
     
-    result = identify(args.database)
+    # Batch mode: many paths and/or a directory, identified in this process
+    if args.dir or len(args.database) > 1 or args.ndjson:
+        filepaths = list(args.database)
+        if args.dir:
+            if not Path(args.dir).is_dir():
+                print(f"ERROR: Not a directory: {args.dir}", file=sys.stderr)
+                sys.exit(1)
+            filepaths.extend(find_database_files(args.dir, args.recursive))
+        
+        results = identify_many(filepaths, args.workers)
+        if args.ndjson:
+            for result in results:
+                print(json.dumps(result), flush=True)
+        elif args.json:
+            print(json.dumps(list(results), indent=2))
+        else:
+            for result in results:
+                if "error" in result:
+                    print(f"{result['input']}: ERROR {result['error']}")
+                else:
+                    print(f"{result['input']}: {result['format']} "
+                          f"({result['confidence']} confidence)")
+        return
+    
+    result = identify(args.database[0])
     
     if args.json:
         print(json.dumps(result, indent=2))
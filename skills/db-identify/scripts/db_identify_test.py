@@ -0,0 +1,49 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from db_identify import find_database_files
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestFindDatabaseFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        for name in [
+            "course.db",
+            "notes.txt",
+            ".file_router_cache.sqlite",
+            ".hidden.db",
+            os.path.join("lessons", "lesson1.sqlite"),
+            os.path.join(".git", "index.db"),
+        ]:
+            path = Path(self.tmpdir) / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def names(self, recursive):
+        return [
+            os.path.relpath(path, self.tmpdir)
+            for path in find_database_files(self.tmpdir, recursive)
+        ]
+
+    def test_skips_dotfiles(self):
+        """Test that hidden files such as the router cache are not picked up"""
+        self.assertEqual(self.names(recursive=False), ["course.db"])
+
+    def test_recursive_skips_hidden_directories(self):
+        """Test that recursive scans skip hidden files and directories"""
+        self.assertEqual(
+            self.names(recursive=True),
+            ["course.db", os.path.join("lessons", "lesson1.sqlite")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
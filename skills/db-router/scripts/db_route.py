@@ -9,6 +9,8 @@ Usage:
     python db_route.py --format sqlite --dbeaver-supported true
     python db_route.py --json '{"format": "sqlite", "dbeaver_supported": true}'
     python db_route.py --file database.db  # runs identification internally
+    python db_route.py --file a.db b.mdb c.sqlite  # NDJSON, one decision per file
+    python db_route.py --dir ./databases  # NDJSON for every database file found
 """
 
 import argparse
@@ -16,6 +18,15 @@ import json
 import subprocess
 import sys
 from pathlib import Path
+from typing import Iterable, Iterator
+
+# db-identify runs in this process when the sibling skill is present
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "db-identify" / "scripts"))
+
+try:
+    import db_identify
+except ImportError:
+    db_identify = None
 
 # Routing table: format → extractor skill
 EXTRACTOR_SKILLS = {
@@ -30,6 +41,9 @@ EXTRACTOR_SKILLS = {
     "derby": "db-extractor-derby",
 }
 
+# Batch mode: identifications in flight at once
+DEFAULT_WORKERS = 8
+
 # Skill availability (which ones are implemented)
 SKILL_STATUS = {
     "db-extractor-sqlite": "available",
@@ -127,17 +141,14 @@ def get_dbeaver_hint(format: str) -> str:
 
 
 def run_identification(filepath: str) -> dict:
-    """Run db_identify.py and parse results."""
-    script_dir = Path(__file__).parent
-    identify_script = script_dir.parent.parent / "db-identify" / "scripts" / "db_identify.py"
-    
-    # Try local path first, then assume it's in PATH
-    if not identify_script.exists():
-        identify_script = "db_identify.py"
+    """Identify a file with db-identify, in-process when available."""
+    if db_identify is not None:
+        return db_identify.identify(filepath)
     
+    # db_identify.py not importable: assume it's in PATH
     try:
         result = subprocess.run(
-            [sys.executable, str(identify_script), filepath, "--json"],
+            [sys.executable, "db_identify.py", filepath, "--json"],
             capture_output=True,
             text=True,
             check=True,
@@ -151,6 +162,38 @@ def run_identification(filepath: str) -> dict:
         return {"error": "db_identify.py not found - run identification manually"}
 
 
+def route_identification(id_result: dict) -> dict:
+    """Route an identification result, keeping it under "identification"."""
+    result = route(
+        format=id_result.get("format"),
+        dbeaver_supported=id_result.get("dbeaver_supported"),
+        confidence=id_result.get("confidence", "high"),
+    )
+    result["identification"] = id_result
+    return result
+
+
+def route_files(filepaths: Iterable[str], workers: int = DEFAULT_WORKERS) -> Iterator[dict]:
+    """
+    Identify and route many files in one process, yielding decisions in input order.
+    
+    Identification runs concurrently through db_identify.identify_many, so a
+    folder of databases costs one interpreter instead of one per file.
+    Failed identifications yield {"path", "error"} records.
+    """
+    if db_identify is None:
+        results = ({"input": fp, **run_identification(fp)} for fp in filepaths)
+    else:
+        results = db_identify.identify_many(filepaths, workers)
+    
+    for id_result in results:
+        path = id_result.pop("input")
+        if "error" in id_result:
+            yield {"path": path, "error": id_result["error"]}
+        else:
+            yield {"path": path, **route_identification(id_result)}
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Route database to appropriate extraction method",
@@ -165,13 +208,24 @@ Examples:
 
   # Identify and route in one step
   python db_route.py --file database.db
+
+  # Many files or a whole folder in one process, as NDJSON
+  python db_route.py --file a.db b.mdb c.sqlite
+  python db_route.py --dir ./databases --recursive
   
   # Show routing table
   python db_route.py --list-routes
         """
     )
     
-    parser.add_argument("--file", "-f", help="Database file (runs identification first)")
+    parser.add_argument("--file", "-f", nargs="+",
+                        help="Database file(s) (runs identification first; "
+                             "several files produce NDJSON)")
+    parser.add_argument("--dir", "-d", help="Route every database file in a directory (NDJSON)")
+    parser.add_argument("--recursive", "-r", action="store_true",
+                        help="Include subdirectories with --dir")
+    parser.add_argument("--workers", "-w", type=int, default=DEFAULT_WORKERS,
+                        help=f"Concurrent identifications in batch mode (default: {DEFAULT_WORKERS})")
     parser.add_argument("--json", "-j", help="Identification JSON from db-identify")
     parser.add_argument("--format", help="Database format")
     parser.add_argument("--dbeaver-supported", type=lambda x: x.lower() == 'true',
@@ -200,9 +254,24 @@ Examples:
             print(f"{fmt:<15} {dbeaver:<10} {skill:<25} {status:<12}")
         return
     
+    # Batch mode: one NDJSON routing decision per file
+    if args.dir or (args.file and len(args.file) > 1):
+        filepaths = list(args.file or [])
+        if args.dir:
+            if not Path(args.dir).is_dir():
+                print(f"ERROR: Not a directory: {args.dir}", file=sys.stderr)
+                sys.exit(1)
+            if db_identify is None:
+                print("ERROR: --dir needs db-identify alongside this skill", file=sys.stderr)
+                sys.exit(1)
+            filepaths.extend(db_identify.find_database_files(args.dir, args.recursive))
+        for result in route_files(filepaths, args.workers):
+            print(json.dumps(result), flush=True)
+        return
+    
     # Get identification info
     if args.file:
-        id_result = run_identification(args.file)
+        id_result = run_identification(args.file[0])
         if "error" in id_result:
             print(f"ERROR: {id_result['error']}", file=sys.stderr)
             sys.exit(1)
@@ -219,14 +288,7 @@ Examples:
         sys.exit(1)
     
     # Route
-    result = route(
-        format=id_result.get("format"),
-        dbeaver_supported=id_result.get("dbeaver_supported"),
-        confidence=id_result.get("confidence", "high"),
-    )
-    
-    # Add source identification
-    result["identification"] = id_result
+    result = route_identification(id_result)
     
     if args.output_json:
         print(json.dumps(result, indent=2))
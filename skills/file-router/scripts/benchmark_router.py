@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+File Router Benchmark - Measure directory routing throughput.
+
+Usage:
+    python benchmark_router.py [OPTIONS]
+    python benchmark_router.py --dir DIRECTORY [OPTIONS]
+    python benchmark_router.py --matcher [OPTIONS]
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from file_router import (  # noqa: E402
+    SIGNATURES,
+    compile_signatures,
+    iter_files,
+    match_signature,
+    route_files,
+)
+
+# Synthetic corpus: (extension, header bytes) - zips are built separately
+SAMPLE_HEADERS = [
+    (".pdf", b"%PDF-1.7\n"),
+    (".png", b"\x89PNG\r\n\x1a\n"),
+    (".jpg", b"\xff\xd8\xff\xe0"),
+    (".db", b"SQLite format 3\x00"),
+    (".gz", b"\x1f\x8b\x08\x00"),
+    (".txt", b"Lesson transcript text\n"),
+    (".py", b"print('hello')\n"),
+    (".mp4", b"\x00\x00\x00\x18ftypmp42"),
+]
+
+ZIP_SAMPLES = [
+    (".docx", "word/document.xml"),
+    (".pptx", "ppt/presentation.xml"),
+    (".zip", "lesson/notes.txt"),
+]
+
+
+def build_corpus(root: Path, count: int) -> int:
+    """Write a mixed corpus of small files under root."""
+    kinds = len(SAMPLE_HEADERS) + len(ZIP_SAMPLES)
+    for i in range(count):
+        subdir = root / f"module_{i % 20:02d}"
+        subdir.mkdir(exist_ok=True)
+        kind = i % kinds
+        if kind < len(SAMPLE_HEADERS):
+            ext, header = SAMPLE_HEADERS[kind]
+            (subdir / f"file_{i}{ext}").write_bytes(header + b"\x00" * 1024)
+        else:
+            ext, member = ZIP_SAMPLES[kind - len(SAMPLE_HEADERS)]
+            with zipfile.ZipFile(subdir / f"file_{i}{ext}", "w") as zf:
+                zf.writestr("[Content_Types].xml", "<Types/>")
+                zf.writestr(member, "<xml/>")
+    return count
+
+
+def linear_match(header: bytes, signatures: list):
+    """Reference matcher: the original linear scan over the signature list."""
+    for offset, magic, file_type, processor in signatures:
+        if len(header) >= offset + len(magic):
+            if header[offset : offset + len(magic)] == magic:
+                return (file_type, processor)
+    return None
+
+
+def synthetic_signatures(count: int, rng: random.Random) -> list:
+    """Extra signatures standing in for future formats (fonts, ebooks, ...)."""
+    extra = []
+    for i in range(count):
+        offset = rng.choice([0, 0, 0, 4, 8, 60])
+        magic = bytes(rng.randrange(256) for _ in range(rng.randint(4, 8)))
+        extra.append((offset, magic, f"synthetic{i}", "passthrough"))
+    return extra
+
+
+def run_matcher(headers: list, extra: int, rounds: int) -> dict:
+    """Time linear vs compiled signature matching over a header corpus."""
+    rng = random.Random(extra)
+    signatures = SIGNATURES + synthetic_signatures(extra, rng)
+    table = compile_signatures(signatures)
+
+    for header in headers:
+        assert linear_match(header, signatures) == match_signature(header, table)
+
+    timings = {}
+    for name, fn in (
+        ("linear", lambda h: linear_match(h, signatures)),
+        ("compiled", lambda h: match_signature(h, table)),
+    ):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for header in headers:
+                fn(header)
+        timings[name] = time.perf_counter() - start
+
+    lookups = len(headers) * rounds
+    return {
+        "signatures": len(signatures),
+        "headers": lookups,
+        "linear_us": round(timings["linear"] / lookups * 1e6, 3),
+        "compiled_us": round(timings["compiled"] / lookups * 1e6, 3),
+        "speedup": round(timings["linear"] / timings["compiled"], 1),
+    }
+
+
+def synthetic_headers(count: int) -> list:
+    """Mixed 512-byte headers: known magics, tar, and unknown noise."""
+    rng = random.Random(0)
+    magics = [magic for offset, magic, _, _ in SIGNATURES if offset == 0]
+    headers = []
+    for i in range(count):
+        body = bytearray(rng.randrange(256) for _ in range(512))
+        kind = i % 4
+        if kind < 2:
+            magic = rng.choice(magics)
+            body[: len(magic)] = magic
+        elif kind == 2:
+            body[257:262] = b"ustar"
+        headers.append(bytes(body))
+    return headers
+
+
+def run_scan(dirpath: str, workers: int) -> dict:
+    """Route every file under dirpath and time it."""
+    start = time.perf_counter()
+    count = 0
+    for _ in route_files(iter_files(dirpath, recursive=True), workers):
+        count += 1
+    elapsed = time.perf_counter() - start
+    return {
+        "workers": workers,
+        "files": count,
+        "seconds": round(elapsed, 3),
+        "files_per_sec": round(count / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="File Router Benchmark - Measure directory routing throughput"
+    )
+    parser.add_argument("-d", "--dir", help="Directory to scan (default: synthetic corpus)")
+    parser.add_argument(
+        "-n", "--files", type=int, default=5000,
+        help="Synthetic corpus size (default: 5000)",
+    )
+    parser.add_argument(
+        "-w", "--workers", default="1,4,16",
+        help="Comma-separated worker counts (default: 1,4,16)",
+    )
+    parser.add_argument(
+        "--matcher", action="store_true",
+        help="Microbenchmark signature matching instead of directory scans",
+    )
+    parser.add_argument(
+        "--extra-signatures", default="0,100,1000",
+        help="Synthetic signatures added for --matcher (default: 0,100,1000)",
+    )
+    parser.add_argument("-j", "--json", action="store_true", help="Output as JSON")
+
+    args = parser.parse_args()
+
+    if args.matcher:
+        headers = synthetic_headers(2000)
+        results = [
+            run_matcher(headers, int(extra), rounds=5)
+            for extra in args.extra_signatures.split(",")
+        ]
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print(f"{'Signatures':>10} {'Linear us':>10} {'Compiled us':>12} {'Speedup':>8}")
+            for r in results:
+                print(
+                    f"{r['signatures']:>10} {r['linear_us']:>10.3f} "
+                    f"{r['compiled_us']:>12.3f} {r['speedup']:>7.1f}x"
+                )
+        return 0
+
+    worker_counts = [int(w) for w in args.workers.split(",")]
+
+    with tempfile.TemporaryDirectory(prefix="router_bench_") as tmp:
+        if args.dir:
+            target = args.dir
+        else:
+            build_corpus(Path(tmp), args.files)
+            target = tmp
+
+        results = [run_scan(target, workers) for workers in worker_counts]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'Workers':>8} {'Files':>8} {'Seconds':>9} {'Files/sec':>11}")
+        for r in results:
+            print(
+                f"{r['workers']:>8} {r['files']:>8} {r['seconds']:>9.3f} {r['files_per_sec']:>11.1f}"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,11 +9,18 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
+import os
+import sqlite3
+import struct
 import sys
+import threading
 import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 # Magic byte signatures: (offset, bytes, file_type, processor)
 SIGNATURES = [
@@ -43,6 +50,32 @@ SIGNATURES = [
     (257, b"ustar", "tar", "archive-extractor"),  # tar magic at offset 257
 ]
 
+
+def compile_signatures(signatures: list) -> list:
+    """
+    Build a dispatch table from a signature list.
+
+    Signatures are grouped by offset, then bucketed on their first bytes (the
+    shortest magic length at that offset). Matching costs one dict lookup per
+    distinct offset instead of a slice per signature. Returns a list of
+    (offset, key_length, {key_bytes: [(priority, magic, file_type, processor)]}).
+    """
+    by_offset = {}
+    for priority, (offset, magic, file_type, processor) in enumerate(signatures):
+        by_offset.setdefault(offset, []).append((priority, magic, file_type, processor))
+
+    table = []
+    for offset, entries in sorted(by_offset.items()):
+        key_length = min(len(entry[1]) for entry in entries)
+        buckets = {}
+        for entry in entries:
+            buckets.setdefault(entry[1][:key_length], []).append(entry)
+        table.append((offset, key_length, buckets))
+    return table
+
+
+SIGNATURE_TABLE = compile_signatures(SIGNATURES)
+
 # OOXML detection for Office docs (all start with PK zip signature)
 OOXML_TYPES = {
     "word/document.xml": ("docx", "docx"),
@@ -50,6 +83,20 @@ OOXML_TYPES = {
     "xl/workbook.xml": ("xlsx", "xlsx-processor"),
 }
 
+OOXML_MARKERS = {marker.encode("ascii"): info for marker, info in OOXML_TYPES.items()}
+
+# Zip structures read by the OOXML fast path
+ZIP_EOCD_SIGNATURE = b"PK\x05\x06"
+ZIP_EOCD_STRUCT = struct.Struct("<4s4H2LH")
+ZIP_CENTRAL_SIGNATURE = b"PK\x01\x02"
+ZIP_CENTRAL_HEADER_SIZE = 46
+ZIP_EOCD_SEARCH_SIZE = ZIP_EOCD_STRUCT.size + 0xFFFF  # record + max comment
+ZIP64_LOCATOR_SIGNATURE = b"PK\x06\x07"
+ZIP64_LOCATOR_STRUCT = struct.Struct("<4sLQL")
+ZIP64_EOCD_SIGNATURE = b"PK\x06\x06"
+ZIP64_EOCD_STRUCT = struct.Struct("<4sQ2H2L4Q")
+ZIP_CENTRAL_READ_SIZE = 64 * 1024
+
 # Extension fallback mapping
 EXTENSION_MAP = {
     # Documents
@@ -148,14 +195,240 @@ EXTENSION_MAP = {
 }
 
 
+# Routing caches live outside the scanned tree, one per resolved scan root
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "ccke" / "file_router"
+LEGACY_CACHE_FILENAME = ".file_router_cache.sqlite"  # older in-tree location
+CACHE_COMMIT_INTERVAL = 1000
+
+
+def rules_fingerprint() -> str:
+    """Hash of the detection tables; cached results are dropped when it changes."""
+    rules = repr((SIGNATURES, OOXML_TYPES, EXTENSION_MAP)).encode("utf-8")
+    return hashlib.blake2b(rules, digest_size=16).hexdigest()
+
+
+class RouteCache:
+    """
+    On-disk cache of route_file results keyed by (path, size, mtime_ns).
+
+    A file whose size or mtime changed misses and is re-detected. The whole
+    cache is invalidated when the detection tables change. Safe to share
+    between worker threads.
+    """
+
+    def __init__(self, db_path: str):
+        self.path = str(db_path)
+        self.hits = 0
+        self.misses = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS routes ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, result TEXT)"
+        )
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'rules'"
+        ).fetchone()
+        fingerprint = rules_fingerprint()
+        if not row or row[0] != fingerprint:
+            self._conn.execute("DELETE FROM routes")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('rules', ?)",
+                (fingerprint,),
+            )
+        self._conn.commit()
+
+    def get(self, path: str, size: int, mtime_ns: int) -> Optional[dict]:
+        """Return the cached result, or None if missing or stale."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mtime_ns, result FROM routes WHERE path = ?", (path,)
+            ).fetchone()
+            if row and row[0] == size and row[1] == mtime_ns:
+                self.hits += 1
+                return json.loads(row[2])
+            self.misses += 1
+            return None
+
+    def put(self, path: str, size: int, mtime_ns: int, result: dict) -> None:
+        """Store a result, replacing any stale entry for the path."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO routes (path, size, mtime_ns, result) "
+                "VALUES (?, ?, ?, ?)",
+                (path, size, mtime_ns, json.dumps(result)),
+            )
+            self._pending += 1
+            if self._pending >= CACHE_COMMIT_INTERVAL:
+                self._conn.commit()
+                self._pending = 0
+
+    def prune(self, root: str, seen_paths: set) -> int:
+        """Drop entries under root for files that no longer exist."""
+        prefix = os.path.join(str(Path(root).absolute()), "")
+        pattern = (
+            prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        )
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path FROM routes WHERE path LIKE ? ESCAPE '\\'", (pattern,)
+            ).fetchall()
+            # LIKE ignores ASCII case, so recheck the prefix exactly
+            stale = [
+                (p,) for (p,) in rows
+                if p.startswith(prefix) and p not in seen_paths
+            ]
+            self._conn.executemany("DELETE FROM routes WHERE path = ?", stale)
+            self._conn.commit()
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with self._lock:
+            self._conn.execute("DELETE FROM routes")
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        return {"enabled": True, "path": self.path, "hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+
+def default_cache_path(dirpath: str) -> Path:
+    """Cache file for a scan root under DEFAULT_CACHE_DIR, keyed by its resolved path."""
+    root = str(Path(dirpath).resolve()).encode("utf-8")
+    return DEFAULT_CACHE_DIR / f"{hashlib.blake2b(root, digest_size=16).hexdigest()}.sqlite"
+
+
+def open_cache(dirpath: str, cache_file: Optional[str] = None) -> Optional[RouteCache]:
+    """Open the routing cache for a scan root; None if it can't be created."""
+    db_path = Path(cache_file) if cache_file else default_cache_path(dirpath)
+    try:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        return RouteCache(str(db_path))
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: routing cache disabled ({db_path}: {e})", file=sys.stderr)
+        return None
+
+
 def read_header(filepath: str, size: int = 512) -> bytes:
     """Read file header for signature detection."""
     with open(filepath, "rb") as f:
         return f.read(size)
 
 
+class UnusualZipError(Exception):
+    """Zip layout the central-directory fast path doesn't handle."""
+
+
+def sniff_central_directory(filepath: str) -> Optional[tuple]:
+    """
+    Look for OOXML markers by scanning raw central-directory filenames.
+
+    Reads only the end-of-central-directory record and as much of the central
+    directory as needed, stopping at the first marker. Zip64 archives are
+    followed through the zip64 end-of-central-directory locator. Raises
+    UnusualZipError for multi-disk or otherwise unexpected layouts.
+    """
+    with open(filepath, "rb") as f:
+        f.seek(0, 2)
+        file_size = f.tell()
+        if file_size < ZIP_EOCD_STRUCT.size:
+            raise UnusualZipError("too small for an end-of-central-directory record")
+
+        tail_size = min(file_size, ZIP_EOCD_SEARCH_SIZE)
+        f.seek(file_size - tail_size)
+        tail = f.read(tail_size)
+
+        # The real record is the one whose comment runs exactly to end of file
+        eocd_pos = tail.rfind(ZIP_EOCD_SIGNATURE)
+        while eocd_pos >= 0:
+            if eocd_pos + ZIP_EOCD_STRUCT.size <= len(tail):
+                fields = ZIP_EOCD_STRUCT.unpack_from(tail, eocd_pos)
+                if eocd_pos + ZIP_EOCD_STRUCT.size + fields[7] == len(tail):
+                    break
+            eocd_pos = tail.rfind(ZIP_EOCD_SIGNATURE, 0, eocd_pos)
+        if eocd_pos < 0:
+            raise UnusualZipError("end-of-central-directory record not found")
+
+        _, disk, cd_disk, _, entries, cd_size, _, _ = fields
+        # Directory end: the EOCD, or the zip64 record just before its locator
+        cd_end = file_size - tail_size + eocd_pos
+
+        locator_pos = cd_end - ZIP64_LOCATOR_STRUCT.size
+        locator = b""
+        if locator_pos >= 0:
+            f.seek(locator_pos)
+            locator = f.read(ZIP64_LOCATOR_STRUCT.size)
+        if locator.startswith(ZIP64_LOCATOR_SIGNATURE):
+            _, _, _, total_disks = ZIP64_LOCATOR_STRUCT.unpack(locator)
+            if total_disks > 1:
+                raise UnusualZipError("multi-disk archive")
+            cd_end = locator_pos - ZIP64_EOCD_STRUCT.size
+            if cd_end < 0:
+                raise UnusualZipError("zip64 end-of-central-directory record not found")
+            f.seek(cd_end)
+            record = f.read(ZIP64_EOCD_STRUCT.size)
+            if not record.startswith(ZIP64_EOCD_SIGNATURE):
+                raise UnusualZipError("zip64 end-of-central-directory record not found")
+            _, _, _, _, disk, cd_disk, _, entries, cd_size, _ = ZIP64_EOCD_STRUCT.unpack(record)
+        elif entries == 0xFFFF or cd_size == 0xFFFFFFFF:
+            raise UnusualZipError("zip64 fields without a zip64 record")
+        if disk or cd_disk:
+            raise UnusualZipError("multi-disk archive")
+
+        # Locate the directory relative to its end so prepended data is tolerated
+        cd_start = cd_end - cd_size
+        if cd_start < 0:
+            raise UnusualZipError("central directory out of bounds")
+
+        f.seek(cd_start)
+        remaining = cd_size
+        buf = b""
+        pos = 0
+        for _ in range(entries):
+            if len(buf) - pos < ZIP_CENTRAL_HEADER_SIZE:
+                chunk = f.read(min(remaining, ZIP_CENTRAL_READ_SIZE))
+                remaining -= len(chunk)
+                buf = buf[pos:] + chunk
+                pos = 0
+            if buf[pos : pos + 4] != ZIP_CENTRAL_SIGNATURE:
+                raise UnusualZipError("bad central directory header")
+
+            name_len, extra_len, comment_len = struct.unpack_from("<3H", buf, pos + 28)
+            name_start = pos + ZIP_CENTRAL_HEADER_SIZE
+            entry_end = name_start + name_len + extra_len + comment_len
+            while len(buf) < entry_end and remaining > 0:
+                chunk = f.read(min(remaining, ZIP_CENTRAL_READ_SIZE))
+                remaining -= len(chunk)
+                buf += chunk
+            if len(buf) < entry_end:
+                raise UnusualZipError("truncated central directory")
+
+            info = OOXML_MARKERS.get(buf[name_start : name_start + name_len])
+            if info:
+                return info
+            pos = entry_end
+
+    return None
+
+
 def detect_ooxml_type(filepath: str) -> Optional[tuple]:
     """Detect Office XML document type by inspecting zip contents."""
+    try:
+        return sniff_central_directory(filepath)
+    except UnusualZipError:
+        pass
+    except IOError:
+        return None
+
     try:
         with zipfile.ZipFile(filepath, "r") as zf:
             names = zf.namelist()
@@ -167,35 +440,48 @@ def detect_ooxml_type(filepath: str) -> Optional[tuple]:
     return None
 
 
+def match_signature(header: bytes, table: list = SIGNATURE_TABLE) -> Optional[tuple]:
+    """
+    Find the first signature (in table order) matching the header.
+
+    Returns (file_type, processor) or None.
+    """
+    best = None
+    for offset, key_length, buckets in table:
+        candidates = buckets.get(header[offset : offset + key_length])
+        if not candidates:
+            continue
+        for priority, magic, file_type, processor in candidates:
+            if best is not None and priority >= best[0]:
+                break
+            if header.startswith(magic, offset):
+                best = (priority, file_type, processor)
+                break
+    return best[1:] if best else None
+
+
 def detect_by_signature(header: bytes, filepath: str) -> Optional[dict]:
     """Detect file type by magic bytes."""
-    for offset, magic, file_type, processor in SIGNATURES:
-        if len(header) >= offset + len(magic):
-            if header[offset : offset + len(magic)] == magic:
-                # Special handling for PK signature (could be zip or OOXML)
-                if file_type == "zip":
-                    ooxml = detect_ooxml_type(filepath)
-                    if ooxml:
-                        return {
-                            "file_type": ooxml[0],
-                            "processor": ooxml[1],
-                            "detection_method": "signature",
-                            "confidence": "high",
-                        }
-                    # Regular zip file
-                    return {
-                        "file_type": "zip",
-                        "processor": "archive-extractor",
-                        "detection_method": "signature",
-                        "confidence": "high",
-                    }
-                return {
-                    "file_type": file_type,
-                    "processor": processor,
-                    "detection_method": "signature",
-                    "confidence": "high",
-                }
-    return None
+    match = match_signature(header)
+    if not match:
+        return None
+
+    file_type, processor = match
+
+    # Special handling for PK signature (could be zip or OOXML)
+    if file_type == "zip":
+        ooxml = detect_ooxml_type(filepath)
+        if ooxml:
+            file_type, processor = ooxml
+        else:
+            processor = "archive-extractor"
+
+    return {
+        "file_type": file_type,
+        "processor": processor,
+        "detection_method": "signature",
+        "confidence": "high",
+    }
 
 
 def detect_by_extension(filepath: str) -> Optional[dict]:
@@ -221,7 +507,7 @@ def detect_by_extension(filepath: str) -> Optional[dict]:
     return None
 
 
-def route_file(filepath: str) -> dict:
+def route_file(filepath: str, cache: Optional[RouteCache] = None) -> dict:
     """Identify file type and determine processor."""
     path = Path(filepath)
 
@@ -238,6 +524,11 @@ def route_file(filepath: str) -> dict:
         "extension": path.suffix.lower(),
     }
 
+    if cache:
+        cached = cache.get(metadata["path"], stat.st_size, stat.st_mtime_ns)
+        if cached is not None:
+            return cached
+
     # Try signature detection
     try:
         header = read_header(filepath)
@@ -251,32 +542,88 @@ def route_file(filepath: str) -> dict:
 
     # Unknown type
     if not result:
-        return {
+        result = {
             "file_type": "unknown",
             "processor": None,
             "detection_method": "none",
             "confidence": "none",
-            "metadata": metadata,
         }
 
     result["metadata"] = metadata
+    if cache:
+        cache.put(metadata["path"], stat.st_size, stat.st_mtime_ns, result)
     return result
 
 
-def process_directory(dirpath: str, recursive: bool = False) -> list:
-    """Process all files in a directory."""
-    results = []
-    path = Path(dirpath)
-
-    if not path.exists() or not path.is_dir():
-        return [{"error": f"Invalid directory: {dirpath}"}]
-
+def iter_files(dirpath: str, recursive: bool = False) -> Iterator[str]:
+    """Yield file paths in a directory in walk order."""
     glob_pattern = "**/*" if recursive else "*"
-    for file_path in path.glob(glob_pattern):
+    for file_path in Path(dirpath).glob(glob_pattern):
+        if file_path.name.startswith(LEGACY_CACHE_FILENAME):
+            continue
         if file_path.is_file():
-            results.append(route_file(str(file_path)))
+            yield str(file_path)
+
+
+def route_files(
+    filepaths: Iterable[str], workers: int = 1, cache: Optional[RouteCache] = None
+) -> Iterator[dict]:
+    """
+    Route files, yielding results in input order.
+
+    With workers > 1, header reads and OOXML probes run in a thread pool.
+    At most workers * 4 files are in flight, so memory stays bounded on
+    large trees and results stream out as soon as the head of the queue
+    is done.
+    """
+    if workers <= 1:
+        for filepath in filepaths:
+            yield route_file(filepath, cache)
+        return
+
+    window = workers * 4
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for filepath in filepaths:
+            pending.append(executor.submit(route_file, filepath, cache))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def iter_directory(
+    dirpath: str,
+    recursive: bool = False,
+    workers: int = 1,
+    cache: Optional[RouteCache] = None,
+) -> Iterator[dict]:
+    """Route all files in a directory, yielding each result as soon as it is ready."""
+    path = Path(dirpath)
 
-    return results
+    if not path.exists() or not path.is_dir():
+        yield {"error": f"Invalid directory: {dirpath}"}
+        return
+
+    seen = set()
+    for result in route_files(iter_files(dirpath, recursive), workers, cache):
+        if "metadata" in result:
+            seen.add(result["metadata"]["path"])
+        yield result
+
+    # A recursive scan saw every file under the root, so anything else is gone
+    if cache and recursive:
+        cache.prune(dirpath, seen)
+
+
+def process_directory(
+    dirpath: str,
+    recursive: bool = False,
+    workers: int = 1,
+    cache: Optional[RouteCache] = None,
+) -> list:
+    """Process all files in a directory."""
+    return list(iter_directory(dirpath, recursive, workers, cache))
 
 
 def list_supported_types() -> dict:
@@ -328,10 +675,29 @@ def main():
     )
     parser.add_argument("file", nargs="?", help="File to identify and route")
     parser.add_argument("-j", "--json", action="store_true", help="Output as JSON")
+    parser.add_argument(
+        "--ndjson", action="store_true",
+        help="Stream directory results as one JSON record per line",
+    )
     parser.add_argument("-d", "--dir", help="Process directory")
     parser.add_argument(
         "-r", "--recursive", action="store_true", help="Recursive directory scan"
     )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1,
+        help="Parallel workers for directory scans (default: 1)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help=f"Disable the routing cache (kept under {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--cache-file",
+        help=f"Routing cache location (default: one file per directory in {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--clear-cache", action="store_true", help="Discard cached results before scanning"
+    )
     parser.add_argument(
         "-l", "--list-types", action="store_true", help="Show supported file types"
     )
@@ -353,9 +719,35 @@ def main():
 
     # Directory mode
     if args.dir:
-        results = process_directory(args.dir, args.recursive)
+        cache = None
+        if not args.no_cache and Path(args.dir).is_dir():
+            cache = open_cache(args.dir, args.cache_file)
+            if cache and args.clear_cache:
+                cache.clear()
+
+        if args.ndjson:
+            try:
+                for result in iter_directory(args.dir, args.recursive, args.workers, cache):
+                    print(json.dumps(result), flush=True)
+            finally:
+                if cache:
+                    cache.close()
+                    print(f"Cache: {cache.hits} hits, {cache.misses} misses", file=sys.stderr)
+            return 0
+
+        try:
+            results = process_directory(args.dir, args.recursive, args.workers, cache)
+        finally:
+            if cache:
+                cache.close()
+
         if args.json:
-            print(json.dumps(results, indent=2))
+            print(json.dumps({
+                "directory": str(Path(args.dir).absolute()),
+                "file_count": len(results),
+                "files": results,
+                "cache": cache.stats() if cache else {"enabled": False},
+            }, indent=2))
         else:
             for result in results:
                 print(format_human_readable(result))
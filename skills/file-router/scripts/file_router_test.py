@@ -0,0 +1,75 @@
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from file_router import sniff_central_directory
+
+
+def write_docx(path, names=("[Content_Types].xml", "word/document.xml")):
+    with zipfile.ZipFile(path, "w") as zf:
+        for name in names:
+            zf.writestr(name, "<xml/>")
+
+
+def convert_to_zip64(path):
+    """Rewrite a zip's end records as zip64 EOCD + locator + sentinel EOCD."""
+    data = Path(path).read_bytes()
+    eocd_pos = data.rfind(b"PK\x05\x06")
+    _, _, _, _, entries, cd_size, cd_offset, _ = struct.unpack_from("<4s4H2LH", data, eocd_pos)
+    zip64_pos = eocd_pos
+    zip64_eocd = struct.pack(
+        "<4sQ2H2L4Q", b"PK\x06\x06", 44, 45, 45, 0, 0, entries, entries, cd_size, cd_offset
+    )
+    locator = struct.pack("<4sLQL", b"PK\x06\x07", 0, zip64_pos, 1)
+    eocd = struct.pack(
+        "<4s4H2LH", b"PK\x05\x06", 0, 0, 0xFFFF, 0xFFFF, 0xFFFFFFFF, 0xFFFFFFFF, 0
+    )
+    Path(path).write_bytes(data[:eocd_pos] + zip64_eocd + locator + eocd)
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestSniffCentralDirectory(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_plain_zip(self):
+        """Test OOXML detection in a regular zip"""
+        path = os.path.join(self.tmpdir, "doc.docx")
+        write_docx(path)
+        self.assertEqual(sniff_central_directory(path), ("docx", "docx"))
+
+    def test_zip64(self):
+        """Test OOXML detection through the zip64 end-of-central-directory record"""
+        path = os.path.join(self.tmpdir, "doc.docx")
+        write_docx(path)
+        convert_to_zip64(path)
+        with zipfile.ZipFile(path) as zf:
+            self.assertIn("word/document.xml", zf.namelist())
+        self.assertEqual(sniff_central_directory(path), ("docx", "docx"))
+
+    def test_zip64_with_prepended_data(self):
+        """Test that data before the archive doesn't shift the zip64 directory"""
+        path = os.path.join(self.tmpdir, "doc.docx")
+        write_docx(path)
+        convert_to_zip64(path)
+        Path(path).write_bytes(b"\0" * 100 + Path(path).read_bytes())
+        self.assertEqual(sniff_central_directory(path), ("docx", "docx"))
+
+    def test_zip_without_marker(self):
+        """Test that a zip without OOXML markers isn't classified"""
+        path = os.path.join(self.tmpdir, "plain.zip")
+        write_docx(path, names=("a.txt", "b.txt"))
+        convert_to_zip64(path)
+        self.assertIsNone(sniff_central_directory(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
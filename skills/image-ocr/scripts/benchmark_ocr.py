@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+OCR Benchmark - Compare OCR throughput and confidence with and without preprocessing.
+
+Usage:
+    python benchmark_ocr.py --dir FIXTURES [OPTIONS]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from image_ocr import DEFAULT_TARGET_X_HEIGHT, extract_text, iter_images  # noqa: E402
+
+
+def run_config(images: list, name: str, preprocess, lang: str, dpi: int, psm: int) -> dict:
+    """OCR every image with one configuration and aggregate the results."""
+    chars = 0
+    confidences = []
+    errors = 0
+
+    start = time.perf_counter()
+    for image in images:
+        result = extract_text(str(image), lang, dpi, psm, preprocess)
+        if "error" in result:
+            errors += 1
+            continue
+        chars += result["char_count"]
+        confidences.append(result["confidence"])
+    elapsed = time.perf_counter() - start
+
+    return {
+        "config": name,
+        "images": len(images),
+        "errors": errors,
+        "seconds": round(elapsed, 2),
+        "sec_per_image": round(elapsed / len(images), 3) if images else 0.0,
+        "chars": chars,
+        "chars_per_sec": round(chars / elapsed, 1) if elapsed else 0.0,
+        "avg_confidence": round(sum(confidences) / len(confidences), 1) if confidences else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="OCR Benchmark - Compare OCR with and without preprocessing"
+    )
+    parser.add_argument("-d", "--dir", required=True, help="Directory of fixture images")
+    parser.add_argument("-l", "--lang", default="eng", help="Tesseract language code (default: eng)")
+    parser.add_argument("--dpi", type=int, default=300, help="Image DPI (default: 300)")
+    parser.add_argument("--psm", type=int, default=3, help="Page segmentation mode (default: 3)")
+    parser.add_argument(
+        "--target-x-height", type=int, default=DEFAULT_TARGET_X_HEIGHT,
+        help=f"Target x-height in px (default: {DEFAULT_TARGET_X_HEIGHT})",
+    )
+    parser.add_argument("-j", "--json", action="store_true", help="Output as JSON")
+
+    args = parser.parse_args()
+
+    images = sorted(iter_images(args.dir))
+    if not images:
+        print(f"No images found in {args.dir}", file=sys.stderr)
+        return 1
+
+    configs = [
+        ("raw", None),
+        ("preprocess", {"target_x_height": args.target_x_height, "binarize": False}),
+        ("preprocess+binarize", {"target_x_height": args.target_x_height, "binarize": True}),
+    ]
+    results = [
+        run_config(images, name, preprocess, args.lang, args.dpi, args.psm)
+        for name, preprocess in configs
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'Config':<22} {'Images':>7} {'Sec/img':>8} {'Chars/sec':>10} {'Avg conf':>9}")
+        for r in results:
+            print(
+                f"{r['config']:<22} {r['images']:>7} {r['sec_per_image']:>8.3f} "
+                f"{r['chars_per_sec']:>10.1f} {r['avg_confidence']:>9.1f}"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
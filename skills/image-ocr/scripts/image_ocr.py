@@ -8,10 +8,16 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
+import os
+import sqlite3
+import statistics
 import sys
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 try:
     import pytesseract
@@ -25,11 +31,316 @@ except ImportError:
 
 SUPPORTED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff", ".tif"}
 
+# Preprocessing: Tesseract reads best with an x-height around 20-30 px
+DEFAULT_TARGET_X_HEIGHT = 24
+X_HEIGHT_RATIO = 0.5  # x-height as a fraction of ascender-to-descender line height
+MIN_SCALE = 0.25
+MAX_SCALE = 4.0
+SCALE_TOLERANCE = 0.15  # skip resampling when already within 15% of target
+MAX_PIXELS = 25_000_000  # upscaling never produces images larger than this
+ANALYSIS_WIDTH = 800
+
+# OCR result cache shared across runs
+DEFAULT_CACHE_FILE = Path.home() / ".cache" / "ccke" / "image_ocr_cache.sqlite"
+DEFAULT_CACHE_SIZE_MB = 256
+HASH_CHUNK_SIZE = 1024 * 1024
+CACHE_BUSY_TIMEOUT = 30.0  # seconds to wait on another process's write lock
+
+
+def cache_key(image_path: str, params: dict) -> str:
+    """BLAKE2 digest of the image bytes plus the OCR parameters."""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(image_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    digest.update(json.dumps(params, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class OcrCache:
+    """
+    On-disk OCR result cache keyed by content hash and OCR parameters.
+
+    Entries are evicted least-recently-used first once the stored results
+    exceed max_bytes. Only used from the parent process, but several
+    image_ocr processes may share the file: it runs in WAL mode, every
+    write is committed straight away and lock waits use a busy timeout.
+    """
+
+    def __init__(self, db_path: str, max_bytes: int):
+        self.path = str(db_path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=CACHE_BUSY_TIMEOUT)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS ocr ("
+            "key TEXT PRIMARY KEY, result TEXT, size INTEGER, last_used REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ocr_lru ON ocr (last_used)")
+        self._conn.commit()
+        self._total = self._stored_bytes()
+
+    def _stored_bytes(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM ocr").fetchone()[0]
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return a cached result and mark it recently used."""
+        row = self._conn.execute("SELECT result FROM ocr WHERE key = ?", (key,)).fetchone()
+        if not row:
+            self.misses += 1
+            return None
+        self.hits += 1
+        with self._conn:
+            self._conn.execute(
+                "UPDATE ocr SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+        return json.loads(row[0])
+
+    def put(self, key: str, result: dict) -> None:
+        """Store a result, evicting old entries past the size cap."""
+        payload = json.dumps(result)
+        # The connection context commits, or rolls back and releases the lock on error
+        with self._conn:
+            old = self._conn.execute("SELECT size FROM ocr WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ocr (key, result, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, payload, len(payload), time.time()),
+            )
+            self._total += len(payload) - (old[0] if old else 0)
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        # Other processes sharing the file may have added or evicted entries
+        self._total = self._stored_bytes()
+        rows = self._conn.execute("SELECT key, size FROM ocr ORDER BY last_used").fetchall()
+        stale = []
+        for key, size in rows:
+            if self._total <= self.max_bytes:
+                break
+            stale.append((key,))
+            self._total -= size
+        self._conn.executemany("DELETE FROM ocr WHERE key = ?", stale)
+
+    def summary(self) -> str:
+        return f"OCR cache: {self.hits} hits, {self.misses} misses ({self.path})"
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def open_cache(cache_file: Optional[str], size_mb: int) -> Optional[OcrCache]:
+    """Open the OCR cache; None if it can't be created."""
+    db_path = Path(cache_file) if cache_file else DEFAULT_CACHE_FILE
+    try:
+        return OcrCache(str(db_path), size_mb * 1024 * 1024)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: OCR cache disabled ({db_path}: {e})", file=sys.stderr)
+        return None
+
+
+def lookup_cached(image_path: str, params: dict, cache: OcrCache) -> tuple:
+    """Return (cache key, cached result or None) for an image."""
+    try:
+        key = cache_key(image_path, params)
+    except OSError:
+        return None, None
+    try:
+        result = cache.get(key)
+    except sqlite3.Error as e:
+        print(f"Warning: OCR cache lookup failed ({e})", file=sys.stderr)
+        return key, None
+    if result is not None:
+        result["source"] = str(Path(image_path).absolute())
+        result["cached"] = True
+    return key, result
+
+
+def store_result(key: Optional[str], result: dict, cache: OcrCache) -> dict:
+    """Cache a fresh OCR result and flag it as a miss."""
+    if key and "error" not in result:
+        try:
+            cache.put(key, result)
+        except sqlite3.Error as e:
+            print(f"Warning: OCR cache write failed ({e})", file=sys.stderr)
+    result["cached"] = False
+    return result
+
+
+def ocr_image(
+    image_path: str,
+    lang: str,
+    dpi: int,
+    psm: int,
+    cache: Optional[OcrCache] = None,
+    preprocess: Optional[dict] = None,
+) -> dict:
+    """OCR one image, consulting the cache first."""
+    if not cache:
+        return extract_text(image_path, lang, dpi, psm, preprocess)
+    params = {"lang": lang, "dpi": dpi, "psm": psm, "preprocess": preprocess}
+    key, result = lookup_cached(image_path, params, cache)
+    if result is not None:
+        return result
+    return store_result(key, extract_text(image_path, lang, dpi, psm, preprocess), cache)
+
+
+def otsu_threshold(gray: "Image.Image") -> int:
+    """Global Otsu threshold from a grayscale histogram."""
+    histogram = gray.histogram()[:256]
+    total = sum(histogram)
+    weighted_total = sum(i * count for i, count in enumerate(histogram))
+
+    best_threshold, best_variance = 127, 0.0
+    background = 0
+    weighted_background = 0
+    for threshold, count in enumerate(histogram):
+        background += count
+        if background == 0:
+            continue
+        foreground = total - background
+        if foreground == 0:
+            break
+        weighted_background += threshold * count
+        mean_bg = weighted_background / background
+        mean_fg = (weighted_total - weighted_background) / foreground
+        variance = background * foreground * (mean_bg - mean_fg) ** 2
+        if variance > best_variance:
+            best_threshold, best_variance = threshold, variance
+    return best_threshold
+
+
+def ink_mask(gray: "Image.Image", threshold: int) -> "Image.Image":
+    """Mask with text pixels at 255, handling light-on-dark slides."""
+    histogram = gray.histogram()[:256]
+    dark = sum(histogram[: threshold + 1])
+    light = sum(histogram[threshold + 1 :])
+    # Text is the minority class
+    if dark <= light:
+        return gray.point(lambda v: 255 if v <= threshold else 0)
+    return gray.point(lambda v: 255 if v > threshold else 0)
+
+
+def estimate_x_height(gray: "Image.Image") -> Optional[float]:
+    """
+    Estimate text x-height in pixels from the horizontal ink profile.
+
+    Rows containing ink form runs, one per text line; the median run height
+    approximates ascender-to-descender height.
+    """
+    width, height = gray.size
+    if height < 8:
+        return None
+    sample = gray.resize((min(width, ANALYSIS_WIDTH), height), Image.BILINEAR)
+    mask = ink_mask(sample, otsu_threshold(sample))
+    profile = list(mask.resize((1, height), Image.BOX).tobytes())
+
+    runs = []
+    run = 0
+    for value in profile + [0]:
+        # A row is part of a text line when at least ~1% of it is ink
+        if value > 2:
+            run += 1
+        elif run:
+            if run >= 3:
+                runs.append(run)
+            run = 0
+
+    if not runs:
+        return None
+    return statistics.median(runs) * X_HEIGHT_RATIO
+
+
+def preprocess_image(
+    img: "Image.Image",
+    target_x_height: int = DEFAULT_TARGET_X_HEIGHT,
+    binarize: bool = False,
+) -> tuple:
+    """
+    Prepare an image for Tesseract.
+
+    Converts to grayscale, rescales so the estimated x-height lands near
+    target_x_height (0 disables rescaling) and optionally binarizes with Otsu.
+    Returns (image, scale) so the caller can adjust the DPI passed to Tesseract.
+    """
+    gray = img.convert("L")
+    scale = 1.0
+
+    if target_x_height:
+        x_height = estimate_x_height(gray)
+        if x_height:
+            scale = max(MIN_SCALE, min(MAX_SCALE, target_x_height / x_height))
+            if scale > 1.0:
+                pixel_limit = (MAX_PIXELS / (gray.width * gray.height)) ** 0.5
+                scale = max(1.0, min(scale, pixel_limit))
+            if abs(scale - 1.0) <= SCALE_TOLERANCE:
+                scale = 1.0
+        if scale != 1.0:
+            size = (max(1, round(gray.width * scale)), max(1, round(gray.height * scale)))
+            resample = Image.LANCZOS if scale < 1.0 else Image.BICUBIC
+            gray = gray.resize(size, resample)
+
+    if binarize:
+        # Dark text on white, whatever the original polarity
+        gray = ink_mask(gray, otsu_threshold(gray)).point(lambda v: 255 - v)
+
+    return gray, scale
+
+
+def text_from_data(data: dict) -> str:
+    """
+    Rebuild page text from image_to_data output.
+
+    Words are joined per line, lines per paragraph, and paragraphs/blocks are
+    separated by a blank line, matching image_to_string layout.
+    """
+    paragraphs = []
+    lines = []
+    words = []
+    current_line = None
+    current_par = None
+
+    for i, word in enumerate(data["text"]):
+        if int(data["level"][i]) != 5 or not word.strip():
+            continue
+        par_key = (data["page_num"][i], data["block_num"][i], data["par_num"][i])
+        line_key = par_key + (data["line_num"][i],)
+
+        if line_key != current_line:
+            if words:
+                lines.append(" ".join(words))
+                words = []
+            current_line = line_key
+        if par_key != current_par:
+            if lines:
+                paragraphs.append("\n".join(lines))
+                lines = []
+            current_par = par_key
+        words.append(word)
+
+    if words:
+        lines.append(" ".join(words))
+    if lines:
+        paragraphs.append("\n".join(lines))
+    return "\n\n".join(paragraphs)
+
 
 def extract_text(
-    image_path: str, lang: str = "eng", dpi: int = 300, psm: int = 3
+    image_path: str,
+    lang: str = "eng",
+    dpi: int = 300,
+    psm: int = 3,
+    preprocess: Optional[dict] = None,
 ) -> dict:
-    """Extract text from image using Tesseract OCR."""
+    """
+    Extract text from image using Tesseract OCR.
+
+    preprocess holds preprocess_image keyword arguments; None feeds the
+    image to Tesseract unchanged.
+    """
     path = Path(image_path)
 
     if not path.exists():
@@ -41,23 +352,23 @@ def extract_text(
     try:
         img = Image.open(image_path)
 
+        if preprocess is not None:
+            img, scale = preprocess_image(img, **preprocess)
+            dpi = max(1, round(dpi * scale))
+
         # Configure tesseract
         config = f"--dpi {dpi} --psm {psm}"
 
-        # Get OCR data with confidence
-        try:
-            data = pytesseract.image_to_data(
-                img, lang=lang, config=config, output_type=pytesseract.Output.DICT
-            )
+        # Single Tesseract pass: words, layout and confidence together
+        data = pytesseract.image_to_data(
+            img, lang=lang, config=config, output_type=pytesseract.Output.DICT
+        )
 
-            # Calculate average confidence (excluding empty entries)
-            confidences = [int(c) for c in data["conf"] if int(c) > 0]
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-        except Exception:
-            avg_confidence = 0
+        # Calculate average confidence (excluding empty entries)
+        confidences = [float(c) for c in data["conf"] if float(c) > 0]
+        avg_confidence = sum(confidences) / len(confidences) if confidences else 0
 
-        # Extract text
-        text = pytesseract.image_to_string(img, lang=lang, config=config)
+        text = text_from_data(data)
 
         return {
             "source": str(path.absolute()),
@@ -75,6 +386,38 @@ def extract_text(
         return {"error": str(e), "source": str(path.absolute())}
 
 
+def iter_images(dir_path: str) -> Iterator[Path]:
+    """
+    Yield supported images under dir_path in a single directory walk.
+
+    Suffixes are matched case-insensitively, so IMG_0001.PNG is found on
+    case-sensitive filesystems. Symlinked directories are not followed.
+    """
+    stack = [dir_path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                subdirs = []
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS:
+                        if entry.is_file():
+                            yield Path(entry.path)
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def write_text_output(result: dict, output_dir: str) -> None:
+    """Write extracted text to output_dir as <image stem>.txt."""
+    if "text" in result and result["text"]:
+        out_path = Path(output_dir) / f"{Path(result['source']).stem}.txt"
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(result["text"], encoding="utf-8")
+
+
 def process_directory(
     dir_path: str,
     output_dir: Optional[str],
@@ -82,28 +425,86 @@ def process_directory(
     dpi: int,
     psm: int,
     quiet: bool,
+    jobs: int = 1,
+    cache: Optional[OcrCache] = None,
+    preprocess: Optional[dict] = None,
 ) -> list:
-    """Process all images in directory."""
-    results = []
+    """
+    Process all images in directory.
+
+    With jobs > 1, images are OCRed in a process pool. Text files are written
+    as each image finishes; the returned list keeps discovery order.
+    """
     dir_path_obj = Path(dir_path)
 
     if not dir_path_obj.exists() or not dir_path_obj.is_dir():
         return [{"error": f"Invalid directory: {dir_path}"}]
 
-    for ext in SUPPORTED_EXTENSIONS:
-        for img_file in dir_path_obj.rglob(f"*{ext}"):
-            if not quiet:
-                print(f"Processing: {img_file}", file=sys.stderr)
-
-            result = extract_text(str(img_file), lang, dpi, psm)
-            results.append(result)
-
-            if output_dir and "text" in result and result["text"]:
-                out_path = Path(output_dir) / f"{img_file.stem}.txt"
-                out_path.parent.mkdir(parents=True, exist_ok=True)
-                out_path.write_text(result["text"], encoding="utf-8")
+    # Discovery is lazy: images are queued for OCR as the walk finds them
+    images = iter_images(dir_path)
+
+    def finish(img_file: Path, result: dict) -> dict:
+        if not quiet:
+            print(f"Processed: {img_file}", file=sys.stderr)
+        if output_dir:
+            write_text_output(result, output_dir)
+        return result
+
+    if jobs <= 1:
+        return [
+            finish(img_file, ocr_image(str(img_file), lang, dpi, psm, cache, preprocess))
+            for img_file in images
+        ]
+
+    # Cache lookups stay in this process; only misses go to the pool. An image
+    # whose key is already in flight waits on that future instead of re-running OCR.
+    params = {"lang": lang, "dpi": dpi, "psm": psm, "preprocess": preprocess}
+    results = {}
+    pending = {}
+    in_flight = {}
+    duplicates = {}
+    window = jobs * 2
+
+    def drain(return_when) -> None:
+        done, _ = wait(pending, return_when=return_when)
+        for future in done:
+            index, img_file, key = pending.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"error": str(e), "source": str(img_file.absolute())}
+            if cache:
+                result = store_result(key, result, cache)
+                in_flight.pop(key, None)
+            results[index] = finish(img_file, result)
+            for dup_index, dup_file in duplicates.pop(future, []):
+                shared = dict(result, source=str(dup_file.absolute()))
+                shared["cached"] = "error" not in result
+                results[dup_index] = finish(dup_file, shared)
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for index, img_file in enumerate(images):
+            key = None
+            if cache:
+                key, cached = lookup_cached(str(img_file), params, cache)
+                if cached is not None:
+                    results[index] = finish(img_file, cached)
+                    continue
+                if key in in_flight:
+                    duplicates.setdefault(in_flight[key], []).append((index, img_file))
+                    continue
+            future = executor.submit(
+                extract_text, str(img_file), lang, dpi, psm, preprocess
+            )
+            pending[future] = (index, img_file, key)
+            if key:
+                in_flight[key] = future
+            if len(pending) >= window:
+                drain(FIRST_COMPLETED)
+        if pending:
+            drain(ALL_COMPLETED)
 
-    return results
+    return [results[i] for i in sorted(results)]
 
 
 def format_human_readable(result: dict) -> str:
@@ -138,16 +539,59 @@ def main():
     parser.add_argument(
         "--psm", type=int, default=3, help="Page segmentation mode (default: 3)"
     )
+    parser.add_argument(
+        "--jobs", type=int, default=1,
+        help="Parallel OCR processes for directory mode (default: 1)",
+    )
+    parser.add_argument(
+        "--preprocess", action="store_true",
+        help="Grayscale and rescale images to a target x-height before OCR",
+    )
+    parser.add_argument(
+        "--target-x-height", type=int, default=DEFAULT_TARGET_X_HEIGHT,
+        help=f"Target x-height in px for --preprocess, 0 = no rescale "
+        f"(default: {DEFAULT_TARGET_X_HEIGHT})",
+    )
+    parser.add_argument(
+        "--binarize", action="store_true", help="Otsu-binarize images (with --preprocess)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Disable the OCR result cache")
+    parser.add_argument(
+        "--cache-file", help=f"OCR cache location (default: {DEFAULT_CACHE_FILE})"
+    )
+    parser.add_argument(
+        "--cache-size-mb", type=int, default=DEFAULT_CACHE_SIZE_MB,
+        help=f"OCR cache size cap in MB (default: {DEFAULT_CACHE_SIZE_MB})",
+    )
     parser.add_argument(
         "-q", "--quiet", action="store_true", help="Suppress progress output"
     )
 
     args = parser.parse_args()
 
+    cache = None
+    if not args.no_cache and (args.dir or args.image):
+        cache = open_cache(args.cache_file, args.cache_size_mb)
+
+    try:
+        return run(args, parser, cache)
+    finally:
+        if cache:
+            cache.close()
+            if not args.quiet:
+                print(cache.summary(), file=sys.stderr)
+
+
+def run(args, parser, cache: Optional[OcrCache]) -> int:
+    preprocess = None
+    if args.preprocess:
+        preprocess = {"target_x_height": args.target_x_height, "binarize": args.binarize}
+
     # Directory mode
     if args.dir:
         results = process_directory(
-            args.dir, args.output, args.lang, args.dpi, args.psm, args.quiet
+            args.dir, args.output, args.lang, args.dpi, args.psm, args.quiet,
+            jobs=args.jobs, cache=cache, preprocess=preprocess,
         )
         if args.json:
             print(json.dumps(results, indent=2))
@@ -162,7 +606,7 @@ def main():
         parser.print_help()
         return 1
 
-    result = extract_text(args.image, args.lang, args.dpi, args.psm)
+    result = ocr_image(args.image, args.lang, args.dpi, args.psm, cache, preprocess)
 
     if args.json:
         output = json.dumps(result, indent=2)
@@ -12,66 +12,97 @@ import random
 import re
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
+
+# Content streaming and keyword scanning are shared with the sibling summary-generator skill
+SUMMARY_SCRIPTS = Path(__file__).resolve().parents[2] / "summary-generator" / "scripts"
+sys.path.insert(0, str(SUMMARY_SCRIPTS))
+
+try:
+    from content_stream import iter_source_files, iter_text_chunks
+    from text_match import KeywordScanner
+except ImportError:
+    print(f"ERROR: quiz-generator needs the summary-generator skill at {SUMMARY_SCRIPTS}",
+          file=sys.stderr)
+    print("Install both skills side by side under skills/", file=sys.stderr)
+    sys.exit(1)
+
+# Concepts kept in memory for question generation (uniform sample beyond this)
+MAX_CONCEPTS = 5000
+
+# Heuristics for "important" sentences
+IMPORTANCE_KEYWORDS = KeywordScanner([
+    "is defined as",
+    "refers to",
+    "means",
+    "important",
+    "key",
+    "primary",
+    "main",
+    "must",
+    "should",
+    "always",
+    "never",
+    "the purpose of",
+    "is used to",
+    "allows",
+    "enables",
+    "provides",
+    "consists of",
+    "includes",
+    "represents",
+])
+
+EXPLANATION_KEYWORDS = KeywordScanner(["because", "therefore", "however", "while", "when"])
+
+
+def clean_srt(text: str) -> str:
+    """Clean SRT format - remove timestamps and sequence numbers."""
+    lines = []
+    for line in text.split("\n"):
+        line = line.strip()
+        # Skip timestamp lines and sequence numbers
+        if re.match(r"^\d+$", line):
+            continue
+        if re.match(r"^\d{2}:\d{2}:\d{2}", line):
+            continue
+        if line:
+            lines.append(line)
+    return " ".join(lines)
 
 
-def load_content(input_dir: str) -> list[dict]:
-    """Load all text content from validated files directory."""
-    content = []
+def iter_content(input_dir: str) -> Iterator[dict]:
+    """
+    Yield text content from the validated files directory one document at a time.
+
+    Large files arrive as several consecutive documents with the same source
+    (see content_stream.iter_text_chunks), so memory use does not grow with
+    the corpus.
+    """
     input_path = Path(input_dir)
 
     if not input_path.exists():
         raise FileNotFoundError(f"Input directory not found: {input_dir}")
 
-    # Load text files
-    for text_file in input_path.rglob("*.txt"):
-        try:
-            text = text_file.read_text(encoding="utf-8", errors="replace")
-            if text.strip():
-                content.append({"source": str(text_file), "text": text})
-        except Exception:
-            continue
+    return _iter_documents(input_path)
 
-    # Load markdown files
-    for md_file in input_path.rglob("*.md"):
-        try:
-            text = md_file.read_text(encoding="utf-8", errors="replace")
-            if text.strip():
-                content.append({"source": str(md_file), "text": text})
-        except Exception:
-            continue
 
-    # Load SRT files (subtitle transcripts)
-    for srt_file in input_path.rglob("*.srt"):
+def _iter_documents(input_path: Path) -> Iterator[dict]:
+    for file_path in iter_source_files(input_path):
         try:
-            text = srt_file.read_text(encoding="utf-8", errors="replace")
-            # Clean SRT format - remove timestamps and numbers
-            lines = []
-            for line in text.split("\n"):
-                line = line.strip()
-                # Skip timestamp lines and sequence numbers
-                if re.match(r"^\d+$", line):
-                    continue
-                if re.match(r"^\d{2}:\d{2}:\d{2}", line):
-                    continue
-                if line:
-                    lines.append(line)
-            cleaned_text = " ".join(lines)
-            if cleaned_text.strip():
-                content.append({"source": str(srt_file), "text": cleaned_text})
+            for text in iter_text_chunks(file_path):
+                # Load SRT files (subtitle transcripts) without timestamps
+                if file_path.suffix == ".srt":
+                    text = clean_srt(text)
+                if text.strip():
+                    yield {"source": str(file_path), "text": text}
         except Exception:
             continue
 
-    # Load CSV files (extract text content)
-    for csv_file in input_path.rglob("*.csv"):
-        try:
-            text = csv_file.read_text(encoding="utf-8", errors="replace")
-            if text.strip():
-                content.append({"source": str(csv_file), "text": text})
-        except Exception:
-            continue
 
-    return content
+def load_content(input_dir: str) -> list[dict]:
+    """Load all text content from validated files directory into memory."""
+    return list(iter_content(input_dir))
 
 
 def clean_text(text: str) -> str:
@@ -90,10 +121,8 @@ def clean_text(text: str) -> str:
     return text.strip()
 
 
-def extract_concepts(content: list[dict]) -> list[dict]:
-    """Extract key concepts and facts from content."""
-    concepts = []
-
+def iter_concepts(content: Iterable[dict]) -> Iterator[dict]:
+    """Yield key concepts and facts from content documents as they are read."""
     for item in content:
         text = clean_text(item["text"])
 
@@ -104,30 +133,8 @@ def extract_concepts(content: list[dict]) -> list[dict]:
             if len(sentence) < 20 or len(sentence) > 500:
                 continue
 
-            # Heuristics for "important" sentences
-            importance_keywords = [
-                "is defined as",
-                "refers to",
-                "means",
-                "important",
-                "key",
-                "primary",
-                "main",
-                "must",
-                "should",
-                "always",
-                "never",
-                "the purpose of",
-                "is used to",
-                "allows",
-                "enables",
-                "provides",
-                "consists of",
-                "includes",
-                "represents",
-            ]
-
-            is_important = any(kw in sentence.lower() for kw in importance_keywords)
+            lowered = sentence.lower()
+            is_important = IMPORTANCE_KEYWORDS.search(lowered)
 
             # Check if starts with capital (likely a statement)
             starts_with_capital = bool(
@@ -136,22 +143,36 @@ def extract_concepts(content: list[dict]) -> list[dict]:
             )
 
             if is_important:
-                concepts.append(
-                    {"text": sentence, "source": item["source"], "type": "definition"}
-                )
+                yield {"text": sentence, "source": item["source"], "type": "definition"}
             elif starts_with_capital and len(sentence) > 30:
-                concepts.append(
-                    {"text": sentence, "source": item["source"], "type": "fact"}
-                )
-            elif len(sentence) > 50 and any(
-                word in sentence.lower()
-                for word in ["because", "therefore", "however", "while", "when"]
-            ):
-                concepts.append(
-                    {"text": sentence, "source": item["source"], "type": "explanation"}
-                )
+                yield {"text": sentence, "source": item["source"], "type": "fact"}
+            elif len(sentence) > 50 and EXPLANATION_KEYWORDS.search(lowered):
+                yield {"text": sentence, "source": item["source"], "type": "explanation"}
+
+
+def extract_concepts(content: list[dict]) -> list[dict]:
+    """Extract key concepts and facts from content."""
+    return list(iter_concepts(content))
 
-    return concepts
+
+def sample_concepts(concepts: Iterable[dict], k: int = MAX_CONCEPTS) -> tuple[list[dict], int]:
+    """
+    Keep a uniform random sample of at most k concepts (reservoir sampling).
+
+    Returns (sample, total seen). When there are k or fewer concepts the
+    sample is all of them, in order, and no random numbers are drawn.
+    """
+    sample = []
+    total = 0
+    for concept in concepts:
+        total += 1
+        if len(sample) < k:
+            sample.append(concept)
+        else:
+            slot = random.randrange(total)
+            if slot < k:
+                sample[slot] = concept
+    return sample, total
 
 
 def generate_mc_question(concept: dict, all_concepts: list[dict]) -> Optional[dict]:
@@ -306,20 +327,28 @@ def generate_quiz(
     if seed is not None:
         random.seed(seed)
 
-    # Load and analyze content
+    # Load and analyze content, one document at a time
     try:
-        content = load_content(input_dir)
+        documents = iter_content(input_dir)
     except FileNotFoundError as e:
         return {"error": str(e)}
 
-    if not content:
+    sources = set()
+
+    def counted(documents):
+        for doc in documents:
+            sources.add(doc["source"])
+            yield doc
+
+    concepts, concepts_found = sample_concepts(iter_concepts(counted(documents)))
+
+    if not sources:
         return {"error": "No content found in input directory"}
 
-    concepts = extract_concepts(content)
-    if len(concepts) < 10:
+    if concepts_found < 10:
         return {
-            "error": f"Insufficient concepts extracted ({len(concepts)}). Need at least 10.",
-            "concepts_found": len(concepts),
+            "error": f"Insufficient concepts extracted ({concepts_found}). Need at least 10.",
+            "concepts_found": concepts_found,
         }
 
     random.shuffle(concepts)
@@ -380,8 +409,8 @@ def generate_quiz(
         "status": "success",
         "input_dir": str(Path(input_dir).absolute()),
         "output_dir": str(out_path.absolute()),
-        "content_files_processed": len(content),
-        "concepts_extracted": len(concepts),
+        "content_files_processed": len(sources),
+        "concepts_extracted": concepts_found,
         "question_counts": {
             "mc": len([q for q in questions if q["type"] == "mc"]),
             "tf": len([q for q in questions if q["type"] == "tf"]),
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Matcher Benchmark - Compare per-pattern regex loops with the precompiled text_match engine.
+
+Builds a synthetic transcript corpus (or loads a content directory), splits it
+into sentences once, then runs each extractor's pattern family both ways:
+the original loop of re.search / `kw in sentence.lower()` calls, and the
+PatternSet / KeywordScanner from text_match. Results are checked for equality.
+
+Usage:
+    python benchmark_match.py [OPTIONS]
+    python benchmark_match.py --dir INPUT_DIR [OPTIONS]
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from summary_generate import (  # noqa: E402
+    DEFINITION_PATTERNS,
+    IMPORTANCE_KEYWORDS,
+    TOPIC_PATTERNS,
+    SentenceIndex,
+    load_content,
+)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "quiz-generator" / "scripts"))
+
+import quiz_generate  # noqa: E402
+
+# Synthetic transcript vocabulary
+TERMS = [
+    "Variable", "Function", "Closure", "Recursion", "Database index", "Hash table",
+    "Binary search", "Event loop", "Garbage collector", "Type system", "Thread pool",
+]
+WORDS = (
+    "the a data value code program system memory process time input output list "
+    "loop state user call return error file record page cache server client request "
+    "because when however important key must should always never main primary "
+    "is this it we that of to and in for with you"
+).split()
+TEMPLATES = [
+    "{T} is defined as {w}", "{T} refers to {w}", "{T} means {w}", "{T} is a {w}",
+    "{T}: {w}", "The {t} represents {w}", "{W}", "{W}", "{W}", "{W}", "{W}", "{W}",
+]
+
+
+def build_corpus(size_mb: float) -> list[dict]:
+    """Synthetic lecture transcripts totalling roughly size_mb megabytes."""
+    rng = random.Random(0)
+    content = []
+    total = 0
+    while total < size_mb * 1024 * 1024:
+        sentences = []
+        for _ in range(500):
+            term = rng.choice(TERMS)
+            words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 28)))
+            template = rng.choice(TEMPLATES)
+            sentence = template.format(T=term, t=term.lower(), w=words, W=words.capitalize())
+            sentences.append(sentence + rng.choice(".!?"))
+        text = " ".join(sentences)
+        content.append({"source": f"lesson_{len(content):05d}.txt", "text": text})
+        total += len(text)
+    return content
+
+
+def loop_patterns(patterns: list[str], sentence: str) -> list:
+    """Reference: every matching pattern via one re.search call each."""
+    found = []
+    for i, pattern in enumerate(patterns):
+        match = re.search(pattern, sentence)
+        if match:
+            found.append((i, match.groups()))
+    return found
+
+
+def loop_first(patterns: list[str], sentence: str):
+    """Reference: the first matching pattern via one re.search call each."""
+    for i, pattern in enumerate(patterns):
+        match = re.search(pattern, sentence)
+        if match:
+            return i, match.groups()
+    return None
+
+
+def families():
+    """(name, reference fn, compiled fn) per extractor pattern family."""
+    topic = [p.pattern for p in TOPIC_PATTERNS.patterns]
+    definition = [p.pattern for p in DEFINITION_PATTERNS.patterns]
+    summary_keywords = IMPORTANCE_KEYWORDS.keywords
+    quiz_keywords = quiz_generate.IMPORTANCE_KEYWORDS.keywords
+    explanation = quiz_generate.EXPLANATION_KEYWORDS.keywords
+    return [
+        ("topics", lambda s: loop_patterns(topic, s),
+         lambda s: list(TOPIC_PATTERNS.matches(s))),
+        ("definitions", lambda s: loop_first(definition, s), DEFINITION_PATTERNS.first),
+        ("key_points", lambda s: any(kw in s.lower() for kw in summary_keywords),
+         lambda s: IMPORTANCE_KEYWORDS.search(s.lower())),
+        ("concepts", lambda s: any(kw in s.lower() for kw in quiz_keywords),
+         lambda s: quiz_generate.IMPORTANCE_KEYWORDS.search(s.lower())),
+        ("explanations", lambda s: any(kw in s.lower() for kw in explanation),
+         lambda s: quiz_generate.EXPLANATION_KEYWORDS.search(s.lower())),
+    ]
+
+
+def run_family(name: str, reference, compiled, sentences: list[str]) -> dict:
+    """Time both implementations over every sentence and compare results."""
+    timings = {}
+    results = {}
+    for label, fn in (("loop", reference), ("compiled", compiled)):
+        start = time.perf_counter()
+        results[label] = [fn(sentence) for sentence in sentences]
+        timings[label] = time.perf_counter() - start
+
+    return {
+        "family": name,
+        "sentences": len(sentences),
+        "loop_seconds": round(timings["loop"], 2),
+        "compiled_seconds": round(timings["compiled"], 2),
+        "speedup": round(timings["loop"] / timings["compiled"], 1) if timings["compiled"] else 0.0,
+        "identical": results["loop"] == results["compiled"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Matcher Benchmark - Per-pattern loops vs precompiled text_match"
+    )
+    parser.add_argument("-d", "--dir", help="Content directory (default: synthetic corpus)")
+    parser.add_argument(
+        "--size-mb", type=float, default=100.0,
+        help="Synthetic corpus size in MB (default: 100)",
+    )
+    parser.add_argument("-j", "--json", action="store_true", help="Output as JSON")
+
+    args = parser.parse_args()
+
+    content = load_content(args.dir) if args.dir else build_corpus(args.size_mb)
+    sentences = SentenceIndex(content).sentences
+    print(f"{len(sentences)} sentences from {len(content)} documents", file=sys.stderr)
+
+    results = [
+        run_family(name, reference, compiled, sentences)
+        for name, reference, compiled in families()
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'Family':<13} {'Sentences':>10} {'Loop s':>8} {'Compiled s':>11} {'Speedup':>8} {'Same':>5}")
+        for r in results:
+            print(
+                f"{r['family']:<13} {r['sentences']:>10} {r['loop_seconds']:>8.2f} "
+                f"{r['compiled_seconds']:>11.2f} {r['speedup']:>7.1f}x {str(r['identical']):>5}"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
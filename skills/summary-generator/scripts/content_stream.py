@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Content Stream - Lazy, bounded-memory reading of course content for the generator skills.
+
+Shared by summary_generate and quiz_generate. Files are yielded one at a
+time; files larger than MMAP_THRESHOLD are memory-mapped and yielded in
+chunks of about CHUNK_BYTES cut at sentence boundaries, so no file is ever
+held in memory whole.
+
+Usage:
+    from content_stream import iter_source_files, iter_text_chunks
+
+    for path in iter_source_files("./__cc_validated_files"):
+        for text in iter_text_chunks(path):
+            ...
+"""
+
+import mmap
+from pathlib import Path
+from typing import Iterator
+
+CONTENT_PATTERNS = ("*.txt", "*.md", "*.srt", "*.csv")
+
+# Files above this size are mmapped and read in chunks
+MMAP_THRESHOLD = 4 * 1024 * 1024
+CHUNK_BYTES = 1024 * 1024
+
+# Preferred chunk cut points: end of sentence, end of line, any space.
+# All are ASCII, so cutting after one never splits a UTF-8 sequence; a window
+# with none of them is cut before the nearest UTF-8 lead byte instead.
+CHUNK_BOUNDARIES = (b".", b"\n", b" ")
+
+
+def iter_source_files(input_dir, patterns=CONTENT_PATTERNS) -> Iterator[Path]:
+    """Yield content files under input_dir, one pattern at a time."""
+    input_path = Path(input_dir)
+    for pattern in patterns:
+        yield from input_path.rglob(pattern)
+
+
+def iter_text_chunks(path: Path, chunk_bytes: int = CHUNK_BYTES,
+                     mmap_threshold: int = MMAP_THRESHOLD) -> Iterator[str]:
+    """
+    Yield a file's text, whole for small files and in chunks for large ones.
+
+    Large files are memory-mapped and each chunk ends just after the last
+    sentence boundary (or newline, or space) before chunk_bytes, so
+    sentences are not split across chunks; a window with no such boundary is
+    cut between UTF-8 characters. Pages already read are released where
+    madvise is available. Undecodable bytes are replaced.
+    """
+    size = path.stat().st_size
+    if size <= mmap_threshold:
+        yield path.read_text(encoding="utf-8", errors="replace")
+        return
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            end = min(start + chunk_bytes, size)
+            if end < size:
+                for boundary in CHUNK_BOUNDARIES:
+                    cut = mm.rfind(boundary, start, end)
+                    if cut >= 0:
+                        end = cut + 1
+                        break
+                else:
+                    # Don't start the next chunk on a UTF-8 continuation byte
+                    lead = end
+                    while lead > start and mm[lead] & 0xC0 == 0x80:
+                        lead -= 1
+                    if lead > start:
+                        end = lead
+            yield mm[start:end].decode("utf-8", errors="replace")
+            start = end
+            # Pages already consumed would otherwise stay resident until unmap
+            if hasattr(mmap, "MADV_DONTNEED"):
+                mm.madvise(mmap.MADV_DONTNEED, 0, end - end % mmap.PAGESIZE)
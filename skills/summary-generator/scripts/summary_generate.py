@@ -7,12 +7,16 @@ Usage:
 """
 
 import argparse
+import heapq
 import json
 import re
 import sys
-from collections import Counter
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+from content_stream import iter_source_files, iter_text_chunks
+from text_match import KeywordScanner, PatternSet
 
 
 def clean_text(text: str) -> str:
@@ -26,136 +30,207 @@ def clean_text(text: str) -> str:
     return text.strip()
 
 
-def load_content(input_dir: str) -> list[dict]:
-    """Load all text content from validated files directory."""
-    content = []
+def iter_content(input_dir: str) -> Iterator[dict]:
+    """
+    Yield cleaned documents from the validated files directory one at a time.
+
+    Large files arrive as several consecutive documents with the same source
+    (see content_stream.iter_text_chunks), so memory use does not grow with
+    the corpus.
+    """
     input_path = Path(input_dir)
 
     if not input_path.exists():
         raise FileNotFoundError(f"Input directory not found: {input_dir}")
 
-    extensions = ["*.txt", "*.md", "*.srt", "*.csv"]
-    for ext in extensions:
-        for file_path in input_path.rglob(ext):
-            try:
-                text = file_path.read_text(encoding="utf-8", errors="replace")
+    return _iter_documents(input_path)
+
+
+def _iter_documents(input_path: Path) -> Iterator[dict]:
+    for file_path in iter_source_files(input_path):
+        try:
+            for text in iter_text_chunks(file_path):
                 if text.strip():
-                    content.append({
+                    yield {
                         "source": str(file_path),
                         "filename": file_path.name,
                         "text": clean_text(text)
-                    })
-            except Exception:
-                continue
-
-    return content
-
-
-def extract_topics(content: list[dict], max_topics: int = 20) -> list[dict]:
-    """Extract main topics from content."""
-    topics = []
-    all_text = " ".join(item["text"] for item in content)
-
-    # Extract sentences that look like topic definitions
-    sentences = re.split(r"[.!?]+", all_text)
+                    }
+        except Exception:
+            continue
 
-    topic_indicators = [
-        r"^([A-Z][a-z]+(?:\s+[A-Z]?[a-z]+)*)\s+(?:is|are|refers to|means|defines)",
-        r"(?:The\s+)?([A-Z][a-z]+(?:\s+[a-z]+)*)\s+(?:is defined as|represents|provides)",
-        r"^([A-Z][a-z]+(?:\s+[a-z]+)*)\s*[-:]\s*",
-    ]
 
-    seen_topics = set()
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if len(sentence) < 20 or len(sentence) > 500:
-            continue
+def load_content(input_dir: str) -> list[dict]:
+    """Load all text content from validated files directory into memory."""
+    return list(iter_content(input_dir))
+
+
+# Sentence boundaries: runs of text between terminal punctuation
+SENTENCE_RE = re.compile(r"[^.!?]+")
+
+# Sentences that look like topic definitions, tried in order. Each pattern
+# lists literals one of which it needs, so most sentences skip the regex.
+TOPIC_PATTERNS = PatternSet([
+    (r"^([A-Z][a-z]+(?:\s+[A-Z]?[a-z]+)*)\s+(?:is|are|refers to|means|defines)",
+     ["is", "are", "refers to", "means", "defines"]),
+    (r"(?:The\s+)?([A-Z][a-z]+(?:\s+[a-z]+)*)\s+(?:is defined as|represents|provides)",
+     ["is defined as", "represents", "provides"]),
+    (r"^([A-Z][a-z]+(?:\s+[a-z]+)*)\s*[-:]\s*", ["-", ":"]),
+])
+
+DEFINITION_PATTERNS = PatternSet([
+    (r"([A-Z][a-z]+(?:\s+[a-z]+)*)\s+is defined as\s+(.+)", ["is defined as"]),
+    (r"([A-Z][a-z]+(?:\s+[a-z]+)*)\s+refers to\s+(.+)", ["refers to"]),
+    (r"([A-Z][a-z]+(?:\s+[a-z]+)*)\s+means\s+(.+)", ["means"]),
+    (r"([A-Z][a-z]+(?:\s+[a-z]+)*)\s+is\s+(?:a|an|the)\s+(.+)", ["is"]),
+])
+
+IMPORTANCE_KEYWORDS = KeywordScanner([
+    "important", "key", "essential", "must", "should", "always",
+    "never", "critical", "fundamental", "primary", "main"
+])
+
+
+class SentenceIndex:
+    """
+    Sentences of one or more documents, split once and shared by all extractors.
+
+    Each sentence keeps its stripped text, lowercase text and source (content
+    item index and character offset in its cleaned text). words maps each
+    lowercase word to the ascending ids of the sentences containing it, so
+    word lookups touch only matching sentences; it is built on first use.
+    """
+
+    def __init__(self, content: list[dict]):
+        self.sentences = []
+        self.lowered = []
+        self.sources = []
+        self._words = None
+
+        for doc, item in enumerate(content):
+            for match in SENTENCE_RE.finditer(item["text"]):
+                raw = match.group()
+                sentence = raw.strip()
+                if not sentence:
+                    continue
+                self.sentences.append(sentence)
+                self.lowered.append(sentence.lower())
+                self.sources.append((doc, match.start() + len(raw) - len(raw.lstrip())))
+
+    def __len__(self) -> int:
+        return len(self.sentences)
+
+    @property
+    def words(self) -> dict:
+        if self._words is None:
+            self._words = defaultdict(list)
+            for sentence_id, lowered in enumerate(self.lowered):
+                for word in set(lowered.split()):
+                    self._words[word].append(sentence_id)
+        return self._words
+
+    def containing_any(self, words) -> Iterator[int]:
+        """Ids of sentences containing any of the words, ascending, each once."""
+        postings = [self.words[word] for word in words if word in self.words]
+        last = None
+        for sentence_id in heapq.merge(*postings):
+            if sentence_id != last:
+                last = sentence_id
+                yield sentence_id
+
+
+class TopicExtractor:
+    """
+    Finds topics across documents fed one SentenceIndex at a time.
+
+    feed() collects the first max_topics topic sentences. Once the topics
+    are known, feed_related() is given the documents again to collect up
+    to five related sentences per topic. State is bounded by max_topics,
+    not by corpus size.
+    """
+
+    def __init__(self, max_topics: int = 20):
+        self.max_topics = max_topics
+        self.topics = []
+        self.seen_topics = set()
+
+    def feed(self, index: SentenceIndex) -> None:
+        # Extract sentences that look like topic definitions
+        for sentence in index.sentences:
+            if len(self.topics) >= self.max_topics:
+                return
+            if len(sentence) < 20 or len(sentence) > 500:
+                continue
 
-        for pattern in topic_indicators:
-            match = re.search(pattern, sentence)
-            if match:
-                topic_name = match.group(1).strip()
-                if topic_name.lower() not in seen_topics and len(topic_name) > 3:
-                    seen_topics.add(topic_name.lower())
-                    topics.append({
+            # Later patterns are still tried when a match names an existing topic
+            for _, groups in TOPIC_PATTERNS.matches(sentence):
+                topic_name = groups[0].strip()
+                if topic_name.lower() not in self.seen_topics and len(topic_name) > 3:
+                    self.seen_topics.add(topic_name.lower())
+                    self.topics.append({
                         "name": topic_name,
                         "description": sentence,
                         "related_sentences": []
                     })
                     break
 
-        if len(topics) >= max_topics:
-            break
-
-    # Find related sentences for each topic
-    for topic in topics:
-        topic_words = set(topic["name"].lower().split())
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) < 30:
+    def feed_related(self, index: SentenceIndex) -> bool:
+        """Add related sentences via the word index; True once every topic has five."""
+        done = True
+        for topic in self.topics:
+            related = topic["related_sentences"]
+            if len(related) >= 5:
                 continue
-            sentence_words = set(sentence.lower().split())
-            if topic_words & sentence_words and sentence != topic["description"]:
-                topic["related_sentences"].append(sentence)
-                if len(topic["related_sentences"]) >= 5:
+            topic_words = set(topic["name"].lower().split())
+            for sentence_id in index.containing_any(topic_words):
+                sentence = index.sentences[sentence_id]
+                if len(sentence) < 30 or sentence == topic["description"]:
+                    continue
+                related.append(sentence)
+                if len(related) >= 5:
                     break
-
-    return topics
-
-
-def extract_definitions(content: list[dict]) -> list[dict]:
-    """Extract key terms and definitions."""
-    definitions = []
-    all_text = " ".join(item["text"] for item in content)
-    sentences = re.split(r"[.!?]+", all_text)
-
-    definition_patterns = [
-        r"([A-Z][a-z]+(?:\s+[a-z]+)*)\s+is defined as\s+(.+)",
-        r"([A-Z][a-z]+(?:\s+[a-z]+)*)\s+refers to\s+(.+)",
-        r"([A-Z][a-z]+(?:\s+[a-z]+)*)\s+means\s+(.+)",
-        r"([A-Z][a-z]+(?:\s+[a-z]+)*)\s+is\s+(?:a|an|the)\s+(.+)",
-    ]
-
-    seen_terms = set()
-    for sentence in sentences:
-        sentence = sentence.strip()
-        for pattern in definition_patterns:
-            match = re.search(pattern, sentence)
-            if match:
-                term = match.group(1).strip()
-                definition = match.group(2).strip()
-                if term.lower() not in seen_terms and len(definition) > 10:
-                    seen_terms.add(term.lower())
-                    definitions.append({
+            done = done and len(related) >= 5
+        return done
+
+
+class DefinitionExtractor:
+    """Collects the first `limit` distinct term definitions across documents."""
+
+    def __init__(self, limit: int = 30):
+        self.limit = limit
+        self.definitions = []
+        self.seen_terms = set()
+
+    def feed(self, index: SentenceIndex) -> None:
+        for sentence in index.sentences:
+            if len(self.definitions) >= self.limit:
+                return
+            found = DEFINITION_PATTERNS.first(sentence)
+            if found:
+                term, definition = (group.strip() for group in found[1])
+                if term.lower() not in self.seen_terms and len(definition) > 10:
+                    self.seen_terms.add(term.lower())
+                    self.definitions.append({
                         "term": term,
                         "definition": definition[:200]
                     })
-                break
-
-    return definitions[:30]  # Limit to 30 definitions
 
 
-def extract_key_points(content: list[dict]) -> list[str]:
-    """Extract key points and facts."""
-    key_points = []
-    all_text = " ".join(item["text"] for item in content)
-    sentences = re.split(r"[.!?]+", all_text)
+class KeyPointExtractor:
+    """Collects the first `limit` sentences with importance keywords across documents."""
 
-    importance_keywords = [
-        "important", "key", "essential", "must", "should", "always",
-        "never", "critical", "fundamental", "primary", "main"
-    ]
+    def __init__(self, limit: int = 20):
+        self.limit = limit
+        self.key_points = []
 
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if len(sentence) < 30 or len(sentence) > 300:
-            continue
-        if any(kw in sentence.lower() for kw in importance_keywords):
-            key_points.append(sentence)
-            if len(key_points) >= 20:
-                break
-
-    return key_points
+    def feed(self, index: SentenceIndex) -> None:
+        for sentence, lowered in zip(index.sentences, index.lowered):
+            if len(self.key_points) >= self.limit:
+                return
+            if len(sentence) < 30 or len(sentence) > 300:
+                continue
+            if IMPORTANCE_KEYWORDS.search(lowered):
+                self.key_points.append(sentence)
 
 
 def generate_readme(
@@ -292,17 +367,37 @@ def generate_summary(
 ) -> dict:
     """Generate summary documentation from content directory."""
     try:
-        content = load_content(input_dir)
+        documents = iter_content(input_dir)
     except FileNotFoundError as e:
         return {"error": str(e)}
 
-    if not content:
+    # Pass 1: topics, definitions and key points, one document at a time
+    topic_extractor = TopicExtractor(max_topics)
+    definition_extractor = DefinitionExtractor()
+    key_point_extractor = KeyPointExtractor()
+    files_processed = 0
+    last_source = None
+    for doc in documents:
+        if doc["source"] != last_source:
+            files_processed += 1
+            last_source = doc["source"]
+        index = SentenceIndex([doc])
+        topic_extractor.feed(index)
+        definition_extractor.feed(index)
+        key_point_extractor.feed(index)
+
+    if not files_processed:
         return {"error": "No content found in input directory"}
 
-    # Extract information
-    topics = extract_topics(content, max_topics)
-    definitions = extract_definitions(content)
-    key_points = extract_key_points(content)
+    # Pass 2: related sentences, stopping once every topic has enough
+    if topic_extractor.topics:
+        for doc in iter_content(input_dir):
+            if topic_extractor.feed_related(SentenceIndex([doc])):
+                break
+
+    topics = topic_extractor.topics
+    definitions = definition_extractor.definitions
+    key_points = key_point_extractor.key_points
 
     if len(topics) < 2 and len(definitions) < 3:
         return {
@@ -357,7 +452,7 @@ def generate_summary(
         "input_dir": str(Path(input_dir).absolute()),
         "output_dir": str(out_path.absolute()),
         "course_name": course_name,
-        "content_files_processed": len(content),
+        "content_files_processed": files_processed,
         "topics_extracted": len(topics),
         "definitions_extracted": len(definitions),
         "key_points_extracted": len(key_points),
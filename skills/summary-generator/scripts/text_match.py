@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Text Match - Precompiled pattern families and keyword scanning for the content extractors.
+
+Shared by summary_generate and quiz_generate. A PatternSet compiles a list of
+regex patterns into a single alternation, skipping patterns whose required
+literals are absent, and a KeywordScanner compiles a keyword list into one
+trie-shaped regex. Each sentence is then scanned by C-level regex calls
+instead of a Python loop over pattern strings or keywords.
+
+Usage:
+    from text_match import KeywordScanner, PatternSet
+
+    definitions = PatternSet([
+        (r"([A-Z]\\w+) refers to (.+)", ["refers to"]),
+        (r"([A-Z]\\w+) means (.+)", ["means"]),
+    ])
+    match = definitions.first(sentence)   # (pattern index, groups) or None
+
+    important = KeywordScanner(["important", "key", "must"])
+    important.search(sentence.lower())    # True if any keyword occurs
+"""
+
+import re
+from typing import Iterator, Optional
+
+
+def _name_groups(pattern: str, prefix: str) -> tuple[str, list[str]]:
+    """Rewrite a pattern's numbered capture groups as named groups prefix_1, prefix_2, ..."""
+    out = []
+    names = []
+    i = 0
+    in_class = False
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            out.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if in_class:
+            in_class = ch != "]"
+        elif ch == "[":
+            in_class = True
+            # A leading ] (or ^]) is a literal inside the class
+            j = i + 1 + (pattern[i + 1:i + 2] == "^")
+            if pattern[j:j + 1] == "]":
+                out.append(pattern[i:j + 1])
+                i = j + 1
+                continue
+        elif ch == "(" and pattern[i + 1:i + 2] != "?":
+            names.append(f"{prefix}_{len(names) + 1}")
+            out.append(f"(?P<{names[-1]}>")
+            i += 1
+            continue
+        out.append(ch)
+        i += 1
+    return "".join(out), names
+
+
+class PatternSet:
+    """
+    A family of regex patterns compiled into a single alternation.
+
+    Patterns are tried in list order, like a loop of re.search calls: the
+    combined regex is anchored at the start and each alternative is
+    `.*?(?P<_i>pattern_i)`, so alternative i only loses to an earlier
+    pattern that matches somewhere in the text. Capture groups keep their
+    order and are returned as a tuple, as match.groups() would.
+
+    A pattern may be given as (pattern, literals), where literals are strings
+    one of which occurs verbatim in any text the pattern can match. Patterns
+    whose literals are all absent are dropped before the regex runs; the
+    alternation over the remaining patterns is compiled on first use and
+    cached.
+    """
+
+    def __init__(self, patterns: list, flags: int = 0):
+        self.flags = flags
+        self.patterns = []
+        self.prefilters = []
+        self.alternatives = []
+        self.group_names = []
+        for i, entry in enumerate(patterns):
+            pattern, literals = entry if isinstance(entry, tuple) else (entry, None)
+            named, names = _name_groups(pattern, f"_{i}")
+            self.patterns.append(re.compile(pattern, flags))
+            self.prefilters.append(
+                KeywordScanner(literals) if literals and not flags & re.IGNORECASE else None
+            )
+            self.alternatives.append(f"(?s:.*?)(?P<_{i}>{named})")
+            self.group_names.append(names)
+        self.combined = {}
+
+    def candidates(self, text: str) -> tuple:
+        """Indexes of patterns whose literal prefilter passes for text."""
+        return tuple(
+            i for i, prefilter in enumerate(self.prefilters)
+            if prefilter is None or prefilter.search(text)
+        )
+
+    def first(self, text: str) -> Optional[tuple[int, tuple]]:
+        """(index, groups) of the first pattern in list order that matches text, else None."""
+        candidates = self.candidates(text)
+        if not candidates:
+            return None
+        combined = self.combined.get(candidates)
+        if combined is None:
+            alternation = "|".join(self.alternatives[i] for i in candidates)
+            combined = self.combined[candidates] = re.compile(f"(?:{alternation})", self.flags)
+        match = combined.match(text)
+        if match is None:
+            return None
+        index = int(match.lastgroup[1:])
+        return index, tuple(match.group(name) for name in self.group_names[index])
+
+    def matches(self, text: str) -> Iterator[tuple[int, tuple]]:
+        """(index, groups) for every pattern that matches text, in list order."""
+        found = self.first(text)
+        if found is None:
+            return
+        yield found
+        # Only texts that already matched fall back to the individual patterns
+        for index in range(found[0] + 1, len(self.patterns)):
+            prefilter = self.prefilters[index]
+            if prefilter is not None and not prefilter.search(text):
+                continue
+            match = self.patterns[index].search(text)
+            if match:
+                yield index, match.groups()
+
+
+class KeywordScanner:
+    """
+    Finds any of a set of keywords in text with a single regex pass.
+
+    The keywords are merged into a prefix trie, and the trie is written out
+    as one regex, e.g. ["main", "must", "means"] becomes
+    `m(?:ain|eans|ust)`. Shared prefixes are tested once per position and
+    the whole scan runs inside the regex engine, Aho-Corasick style, rather
+    than one substring search per keyword. Matching is case-sensitive, so
+    callers pass lowercased text for lowercase keywords. With no keywords
+    nothing matches.
+    """
+
+    def __init__(self, keywords: list[str]):
+        self.keywords = list(keywords)
+        trie = {}
+        for keyword in self.keywords:
+            node = trie
+            for ch in keyword:
+                node = node.setdefault(ch, {})
+            node[""] = True
+        # An empty trie would compile to an empty pattern that matches everywhere
+        self.regex = re.compile(self._trie_regex(trie)) if trie else None
+
+    @classmethod
+    def _trie_regex(cls, node: dict) -> str:
+        branches = [re.escape(ch) + cls._trie_regex(child)
+                    for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            # Keyword ends here but longer keywords continue: the rest is optional
+            return f"(?:{body})?"
+        return body
+
+    def search(self, text: str) -> bool:
+        """True if any keyword occurs in text."""
+        return self.regex is not None and self.regex.search(text) is not None
+
+    def find(self, text: str) -> Optional[str]:
+        """The leftmost keyword occurrence in text (longest at that position), else None."""
+        if self.regex is None:
+            return None
+        match = self.regex.search(text)
+        return match.group() if match else None